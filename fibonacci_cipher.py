@@ -2,8 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import time
-import tracemalloc
-from tabulate import tabulate
+_IMPORT_STARTED = time.perf_counter()
 import sys
 import gc
 import random
@@ -11,25 +10,63 @@ import string
 import argparse
 import os
 import platform
-from colorama import Fore, Back, Style, init
-from pyfiglet import Figlet
-from tqdm import tqdm
 import math
+import re
+import struct
+import codecs
+import io
+from array import array
+from collections import OrderedDict, deque
+import functools
+import glob
+import mmap
+import signal
+import json
+import threading
 
-# Colorama başlatma
-init(autoreset=True)
+# Arayüz kütüphaneleri (colorama, pyfiglet, tabulate, tqdm) ve NumPy ilk kullanımda yüklenir;
+# böylece başsız (headless) komutlar bunların yükleme maliyetini ödemez.
+np = None
+
+@functools.lru_cache(maxsize=None)
+def _colorama():
+    """colorama'yı yükler ve başlatır."""
+    import colorama
+    colorama.init(autoreset=True)
+    return colorama
+
+class _LazyColor:
+    """colorama'nın Fore / Back / Style nesnelerine ilk erişimde colorama'yı yükleyen vekil."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(getattr(_colorama(), self._name), attr)
+
+Fore, Back, Style = _LazyColor('Fore'), _LazyColor('Back'), _LazyColor('Style')
+
+def tabulate(*args, **kwargs):
+    from tabulate import tabulate as _tabulate
+    return _tabulate(*args, **kwargs)
+
+def tqdm(*args, **kwargs):
+    from tqdm import tqdm as _tqdm
+    return _tqdm(*args, **kwargs)
 
 # Ekranı temizleme işlevi
 def clear_screen():
-    """İşletim sistemine göre terminal ekranını temizler."""
+    """Terminal ekranını temizler (POSIX'te kabuk çalıştırmadan ANSI koduyla)."""
     if platform.system() == "Windows":
         os.system("cls")
-    else:
-        os.system("clear")
+    elif sys.stdout.isatty():
+        sys.stdout.write("\033[H\033[2J")
+        sys.stdout.flush()
 
 # Banner oluşturma
 def print_banner(text, font="slant"):
     """Figlet kullanarak banner oluşturur."""
+    from pyfiglet import Figlet
     f = Figlet(font=font)
     banner = f.renderText(text)
     print(Fore.CYAN + banner)
@@ -67,11 +104,248 @@ def print_section(text):
     print("\n" + Fore.YELLOW + Style.BRIGHT + text)
     print(Fore.YELLOW + Style.BRIGHT + "-" * len(text) + Style.RESET_ALL + "\n")
 
+# İsteğe bağlı profil sayaçları (--profile / FIB_PROFILE): aşama başına çağrı, süre ve bayt
+PROFILE_STAGES = ('fib_compute', 'transform', 'serialization', 'file_io', 'strength_analysis',
+                  'backend_import')
+PSTATS_SUFFIXES = ('.pstats', '.prof')
+
+class _NullStage:
+    """Profil kapalıyken kullanılan, hiçbir şey ölçmeyen bağlam."""
+
+    nbytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class _StageTimer:
+    """Bir aşamanın süresini ölçer; iç içe aşamaların süresi dıştakinden düşülür."""
+
+    __slots__ = ('profiler', 'stage', 'nbytes', 'started', 'child_ns')
+
+    def __init__(self, profiler, stage, nbytes):
+        self.profiler = profiler
+        self.stage = stage
+        self.nbytes = nbytes
+
+    def __enter__(self):
+        self.profiler._stack().append(self)
+        self.child_ns = 0
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter_ns() - self.started
+        stack = self.profiler._stack()
+        stack.pop()
+        if stack:
+            stack[-1].child_ns += elapsed
+        self.profiler.record(self.stage, elapsed - self.child_ns, self.nbytes)
+        return False
+
+class StageProfiler:
+    """
+    Sıcak yollardaki aşamalar (Fibonacci hesabı, dönüşüm, serileştirme, dosya G/Ç,
+    şifre gücü analizi, NumPy arka ucunun yüklenmesi) için çağrı sayısı, toplam ns ve işlenen bayt sayaçları.
+    Kapalıyken stage() boş bir bağlam döndürür; ölçüm maliyeti yalnızca açıkken ödenir.
+    Süreler özeldir (exclusive): iç içe bir aşamanın süresi dıştaki aşamaya sayılmaz.
+    Python döngüsünde adım adım ilerleyen anahtar akışı dönüşüm aşamasına sayılır.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def reset(self):
+        """Tüm sayaçları sıfırlar."""
+        with self._lock:
+            self.counters = {stage: [0, 0, 0] for stage in PROFILE_STAGES}
+
+    def stage(self, name, nbytes=0):
+        """name aşamasını ölçen bir bağlam yöneticisi döndürür (kapalıyken boş bağlam)."""
+        return _StageTimer(self, name, nbytes) if self.enabled else _NULL_STAGE
+
+    def record(self, stage, elapsed_ns, nbytes=0):
+        with self._lock:
+            counter = self.counters[stage]
+            counter[0] += 1
+            counter[1] += elapsed_ns
+            counter[2] += nbytes
+
+    def snapshot(self):
+        """Sayaçları aşama -> {calls, total_ns, bytes, mean_ns} sözlüğü olarak döndürür."""
+        with self._lock:
+            return {stage: {"calls": calls, "total_ns": total_ns, "bytes": nbytes,
+                            "mean_ns": total_ns / calls if calls else 0.0}
+                    for stage, (calls, total_ns, nbytes) in self.counters.items()}
+
+    def dump(self, path):
+        """Sayaçları JSON olarak path'e yazar."""
+        data = {"pid": os.getpid(), "python": platform.python_version(), "stages": self.snapshot()}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+PROFILER = StageProfiler()
+PROFILE_PATH = os.environ.get("FIB_PROFILE")
+
+def profiled(stage, nbytes=None):
+    """
+    Fonksiyonu PROFILER'ın stage aşamasına sayan dekoratör.
+    nbytes verilirse çağrı argümanlarıyla çağrılıp işlenen bayt sayısını döndürür.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with _StageTimer(PROFILER, stage, nbytes(*args, **kwargs) if nbytes else 0):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class _ProfiledFile:
+    """read/readinto/write çağrılarını file_io aşamasına sayan dosya nesnesi sarmalayıcısı."""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def read(self, *args):
+        with PROFILER.stage('file_io') as timer:
+            data = self._raw.read(*args)
+            timer.nbytes = len(data)
+        return data
+
+    def readinto(self, buffer):
+        with PROFILER.stage('file_io') as timer:
+            count = self._raw.readinto(buffer)
+            timer.nbytes = count or 0
+        return count
+
+    def write(self, data):
+        with PROFILER.stage('file_io', len(data)):
+            return self._raw.write(data)
+
+def _profiled_files(*files):
+    """Profil açıksa dosya nesnelerini _ProfiledFile ile sarar, kapalıysa olduğu gibi döndürür."""
+    if not PROFILER.enabled:
+        return files
+    return tuple(_ProfiledFile(f) for f in files)
+
+def start_profiling(path):
+    """
+    Sayaçları açar ve çıkışta path'e yazar. path .pstats/.prof ile bitiyorsa
+    çalışmanın tamamı cProfile ile izlenir ve pstats dosyası yazılır.
+    """
+    import atexit
+    PROFILER.enabled = True
+    profile = None
+    if path.endswith(PSTATS_SUFFIXES):
+        import cProfile
+        profile = cProfile.Profile()
+        profile.enable()
+    atexit.register(_finish_profiling, path, profile)
+
+def _finish_profiling(path, profile=None):
+    """start_profiling ile başlatılan ölçümü durdurur ve sonucu diske yazar."""
+    if profile is not None:
+        profile.disable()
+        profile.dump_stats(path)
+    else:
+        PROFILER.dump(path)
+
 # Fibonacci algoritmaları
+class FibonacciMemo:
+    """
+    Özyinelemesiz (bottom-up) doldurulan, sınırlandırılabilir Fibonacci önbelleği.
+
+    Her kayıt k -> (F(k), F(k+1)) çiftidir. checkpoint_interval=c ise yalnızca
+    c'nin katları saklanır, aradaki değerler en yakın kontrol noktasından
+    ilerlenerek yeniden hesaplanır. max_entries (kayıt sayısı) veya max_bytes
+    (toplam büyük tamsayı boyutu) aşılınca en uzun süre kullanılmayan (LRU)
+    kayıtlar atılır.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, checkpoint_interval=1):
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval en az 1 olmalı")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, n):
+        return n in self.entries
+
+    def __getitem__(self, n):
+        return self.entries[n][0]
+
+    def clear(self):
+        """Önbelleği boşaltır."""
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def _store(self, k, pair):
+        """Kontrol noktasını kaydeder ve gerekirse LRU kayıtları atar."""
+        if k in self.entries:
+            return
+        self.entries[k] = pair
+        self.total_bytes += sys.getsizeof(pair[0]) + sys.getsizeof(pair[1])
+        while self.entries and ((self.max_entries is not None and len(self.entries) > self.max_entries)
+                                or (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            _, (a, b) = self.entries.popitem(last=False)
+            self.total_bytes -= sys.getsizeof(a) + sys.getsizeof(b)
+
+    def get(self, n):
+        """F(n) değerini döndürür; eksik değerleri en yakın kontrol noktasından doldurur."""
+        if n <= 0:
+            return 0
+        pair = self.entries.get(n)
+        if pair is not None:
+            self.entries.move_to_end(n)
+            return pair[0]
+
+        # n'den küçük en yakın saklı kontrol noktasını bul
+        interval = self.checkpoint_interval
+        k = n - n % interval
+        while k > 0 and k not in self.entries:
+            k -= interval
+        if k > 0:
+            self.entries.move_to_end(k)
+            a, b = self.entries[k]
+        else:
+            a, b = 0, 1
+
+        while k < n:
+            a, b = b, a + b
+            k += 1
+            if k % interval == 0:
+                self._store(k, (a, b))
+        return a
+
+
 class FibonacciMethods:
-    def __init__(self):
-        # Memoizasyon için kullanılacak
-        self.memo = {}
+    def __init__(self, memo=None):
+        # Memoizasyon için kullanılacak (varsayılan: sınırsız, her değer saklanır)
+        self.memo = memo if memo is not None else FibonacciMemo()
 
     def naive_recursive(self, n):
         """Naif özyinelemeli Fibonacci."""
@@ -83,16 +357,8 @@ class FibonacciMethods:
             return self.naive_recursive(n-1) + self.naive_recursive(n-2)
 
     def memoized_recursive(self, n):
-        """Hafızalı özyinelemeli Fibonacci (top-down)."""
-        if n in self.memo:
-            return self.memo[n]
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            self.memo[n] = self.memoized_recursive(n-1) + self.memoized_recursive(n-2)
-            return self.memo[n]
+        """Hafızalı Fibonacci (önbellek özyinelemesiz, bottom-up doldurulur)."""
+        return self.memo.get(n)
 
     def iterative(self, n):
         """Yinelemeli Fibonacci (bottom-up)."""
@@ -133,79 +399,1057 @@ class FibonacciMethods:
         F = matrix_power([[1, 1], [1, 0]], n - 1)
         return F[0][0]
 
+    # Kayan noktalı Binet formülünün tam sonuç verdiği en büyük n
+    BINET_FLOAT_LIMIT = 70
+
     def binet_formula(self, n):
-        """Binet formülü ile Fibonacci."""
+        """Binet formülü ile Fibonacci (n > BINET_FLOAT_LIMIT için tam sayı yoluna geçer)."""
         if n <= 0:
             return 0
         elif n == 1:
             return 1
+        elif n > self.BINET_FLOAT_LIMIT:
+            # float hassasiyeti yetmez (n≈1474 üzerinde OverflowError)
+            return self.binet_exact(n)
             
-        import math
         phi = (1 + math.sqrt(5)) / 2
         psi = (1 - math.sqrt(5)) / 2
         return int((math.pow(phi, n) - math.pow(psi, n)) / math.sqrt(5))
 
+    def binet_exact(self, n):
+        """Binet formülü Z[√5] içinde tam sayılarla: φ^n = (L(n) + F(n)√5) / 2."""
+        if n <= 0:
+            return 0
+        # (L, F) çifti φ^k'yı temsil eder; φ^0 = (2 + 0√5) / 2, φ^1 = (1 + 1√5) / 2
+        L, F = 2, 0
+        base_L, base_F = 1, 1
+        while n:
+            if n & 1:
+                L, F = (L * base_L + 5 * F * base_F) // 2, (L * base_F + F * base_L) // 2
+            base_L, base_F = (base_L * base_L + 5 * base_F * base_F) // 2, base_L * base_F
+            n >>= 1
+        return F
+
+    def fast_doubling(self, n):
+        """Hızlı ikiye katlama (fast doubling) ile Fibonacci: F(2k) ve F(2k+1) özdeşlikleri."""
+        return fibonacci_pair(n)[0]
+
+
+def fibonacci_pair(n, modulus=None):
+    """Hızlı ikiye katlama (fast doubling) ile (F(n), F(n+1)) çiftini döndürür."""
+    if n <= 0:
+        return 0, 1 % modulus if modulus else 1
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if modulus:
+            a, b = a % modulus, b % modulus
+    return a, b
+
+
+class FibonacciTable:
+    """
+    İşlem genelinde paylaşılan, iş parçacığı güvenli F(0)...F(size-1) tablosu.
+    Önek bir kez hesaplanır (veya diskten yüklenir) ve sonrasında O(1) okunur.
+    """
+
+    FILE_VERSION = 1
+
+    def __init__(self, size=0, path=None):
+        self.values = [0, 1]
+        self._lock = threading.Lock()
+        # Dosya var ama bozuksa (veya değiştirilmişse) yok sayılır ve yeniden yazılması gerekir
+        self.stale = bool(path and os.path.exists(path) and not self.load(path))
+        self.ensure(size)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, n):
+        return self.values[n]
+
+    def ensure(self, size):
+        """Tabloyu en az size değer içerecek şekilde genişletir."""
+        if size <= len(self.values):
+            return
+        with self._lock:
+            values = self.values
+            a, b = values[-2], values[-1]
+            # Okuyucular kilitsiz okuyabilir; append işlemi atomiktir
+            for _ in range(size - len(values)):
+                a, b = b, a + b
+                values.append(b)
+
+    def save(self, path):
+        """Tabloyu JSON olarak (onaltılık değerlerle) diske yazar."""
+        with self._lock:
+            data = {"version": self.FILE_VERSION, "values": [format(v, 'x') for v in self.values]}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def is_valid(values):
+        """Değerlerin F(0), F(1), ... dizisi olduğunu (her değer önceki ikisinin toplamı) doğrular."""
+        if values[:2] != [0, 1]:
+            return False
+        return all(values[i] == values[i - 1] + values[i - 2] for i in range(2, len(values)))
+
+    def load(self, path):
+        """
+        Diske kaydedilmiş tabloyu yükler; geçersiz dosyalar yok sayılır ve False döner.
+        Her değer doğrulanır: bozuk bir tablo seek() ve şifre planlarında sessizce
+        sıralı yoldan farklı (çözülemeyen) çıktı üretirdi.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != self.FILE_VERSION:
+                return False
+            values = [int(v, 16) for v in data["values"]]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        if not self.is_valid(values):
+            return False
+        if len(values) > len(self.values):
+            with self._lock:
+                self.values = values
+        return True
+
+
+# Paylaşılan tablo: önek boyutu ve kalıcı dosya ortam değişkenleriyle ayarlanabilir
+SHARED_TABLE_SIZE = int(os.environ.get("FIB_TABLE_SIZE", "512"))
+SHARED_TABLE_PATH = os.environ.get("FIB_TABLE_PATH")
+_shared_table = None
+_shared_table_lock = threading.Lock()
+
+def get_shared_table():
+    """Paylaşılan Fibonacci tablosunu ilk kullanımda oluşturur ve döndürür."""
+    global _shared_table
+    if _shared_table is None:
+        with _shared_table_lock:
+            if _shared_table is None:
+                table = FibonacciTable(SHARED_TABLE_SIZE, SHARED_TABLE_PATH)
+                if SHARED_TABLE_PATH and (table.stale or not os.path.exists(SHARED_TABLE_PATH)):
+                    try:
+                        table.save(SHARED_TABLE_PATH)
+                    except OSError:
+                        pass
+                _shared_table = table
+    return _shared_table
+
+def configure_shared_table(size=None, path=None):
+    """Paylaşılan tabloyu verilen boyut ve dosya ile (yeniden) oluşturur."""
+    global _shared_table, SHARED_TABLE_SIZE, SHARED_TABLE_PATH
+    with _shared_table_lock:
+        if size is not None:
+            SHARED_TABLE_SIZE = size
+        if path is not None:
+            SHARED_TABLE_PATH = path
+        _shared_table = None
+    return get_shared_table()
+
+def with_shared_table(fib_method):
+    """Tam sonuç veren bir yöntemi paylaşılan tablodan O(1) okuma ile sarar."""
+    values = get_shared_table().values
+
+    @functools.wraps(fib_method)
+    def lookup(n):
+        if 0 <= n < len(values):
+            return values[n]
+        return fib_method(n)
+    return lookup
+
+
+class PisanoTable:
+    """
+    F(i) mod 2^bits değerlerinin Pisano periyodu tablosu: π(2^k) = 3·2^(k-1).
+    Periyot PISANO_BLOCK değerinden kısaysa (8 bit: 384) tamamı saklanır;
+    daha uzunsa (32 bit: 3·2^31) her PISANO_BLOCK pozisyonda bir (F(cB), F(cB+1))
+    kontrol noktası ve F(-1)...F(B+1) taban tablosu tutulur. Her iki durumda
+    herhangi bir pozisyona erişim O(1)'dir ve büyük tamsayı işlemi gerektirmez.
+    """
+
+    def __init__(self, bits, block=None):
+        self.modulus = 1 << bits
+        self.period = 3 << (bits - 1)
+        self.block = block or PISANO_BLOCK
+        mask = self.modulus - 1
+        if self.period <= self.block:
+            # Tam tablo: values[i] = F(i) mod m, i = 0..period (son değer F(0)'a döner)
+            self.values = _word_array(32)
+            a, b = 0, 1
+            for _ in range(self.period + 1):
+                self.values.append(a)
+                a, b = b, (a + b) & mask
+            self.checkpoints = None
+            return
+        # Taban tablosu: base[k] = F(k-1) mod m, k = 0..block+2
+        self.base = _word_array(32, [1, 0])
+        a, b = 0, 1
+        for _ in range(self.block + 1):
+            a, b = b, (a + b) & mask
+            self.base.append(a)
+        # Kontrol noktaları: F((c+1)B) = F(cB) F(B-1) + F(cB+1) F(B) ve F((c+1)B+1) benzer şekilde
+        fb_prev, fb, fb_next = self.base[self.block], self.base[self.block + 1], self.base[self.block + 2]
+        self.checkpoints = _word_array(32)
+        a, b = 0, 1
+        for _ in range(self.period // self.block):
+            self.checkpoints.append(a)
+            self.checkpoints.append(b)
+            a, b = (a * fb_prev + b * fb) & mask, (a * fb + b * fb_next) & mask
+
+    def pair(self, n):
+        """(F(n) mod m, F(n+1) mod m) çiftini O(1) sürede döndürür."""
+        n %= self.period
+        if self.checkpoints is None:
+            return self.values[n], self.values[n + 1]
+        c, r = divmod(n, self.block)
+        a, b = self.checkpoints[2 * c], self.checkpoints[2 * c + 1]
+        base = self.base
+        mask = self.modulus - 1
+        # F(cB + r) = F(cB) F(r-1) + F(cB+1) F(r)
+        return (a * base[r] + b * base[r + 1]) & mask, (a * base[r + 1] + b * base[r + 2]) & mask
+
+    def __getitem__(self, n):
+        return self.pair(n)[0]
+
+
+PISANO_BLOCK = 1 << 16  # 32 bit için kontrol noktası aralığı (~1.2 MB tablo)
+_pisano_tables = {}
+_pisano_lock = threading.Lock()
+
+def get_pisano_table(bits):
+    """2^bits modülü için Pisano tablosunu ilk kullanımda oluşturur ve döndürür."""
+    table = _pisano_tables.get(bits)
+    if table is None:
+        with _pisano_lock:
+            table = _pisano_tables.get(bits)
+            if table is None:
+                table = _pisano_tables[bits] = PisanoTable(bits)
+    return table
+
+@functools.lru_cache(maxsize=512)
+def _shift_table(shift, decrypt=False):
+    """Her bayta shift ekleyen (veya çıkaran) mod 256 bytes.translate tablosu."""
+    if decrypt:
+        shift = -shift
+    return bytes((byte + shift) & 0xFF for byte in range(256))
+
+# Sabit genişlikli anahtar akışı için NumPy arka ucu (FIB_BACKEND=python ile kapatılır)
+USE_NUMPY = os.environ.get("FIB_BACKEND", "auto") != "python"
+# Bu boyutun (anahtar akışı baytı) altındaki girdiler NumPy'yi hiç yüklemeden Pisano / saf Python
+# yolunu kullanır; küçük dosyalarda NumPy'nin yükleme süresi dönüşümün kendisinden uzun sürer
+NUMPY_MIN_BYTES = 64 * 1024
+_NUMPY_BASES = {}
+
+def _numpy_enabled():
+    """NumPy arka ucu açıksa NumPy'yi ilk çağrıda yükler; NumPy yoksa arka ucu kapatır."""
+    global np, USE_NUMPY
+    if USE_NUMPY and np is None:
+        try:
+            # Tembel yükleme ilk vektörel dönüşümün içinde olur; süresi dönüşüme sayılmaz
+            with PROFILER.stage('backend_import'):
+                import numpy
+        except ImportError:  # NumPy isteğe bağlıdır; yoksa saf Python yolu kullanılır
+            USE_NUMPY = False
+            return False
+        np = numpy
+    return USE_NUMPY
+
+def _numpy_basis(modulus, count):
+    """
+    j = 0..count-1 için (F(j-1) mod m, F(j) mod m) dizilerini döndürür.
+    Diziler F(n + j) = F(n) F(j-1) + F(n+1) F(j) özdeşliğiyle iki katına
+    büyütülür ve modül başına önbelleğe alınır; uint taşması mod 2^bits'tir.
+    """
+    prev, cur = _NUMPY_BASES.get(modulus) or (None, None)
+    if cur is None:
+        dtype = np.uint8 if modulus == 256 else np.uint32
+        prev, cur = np.array([1, 0], dtype=dtype), np.array([0, 1], dtype=dtype)
+    dtype = cur.dtype.type
+    while len(cur) < count:
+        a, b = fibonacci_pair(len(cur), modulus)
+        prev, cur = (np.concatenate((prev, dtype((b - a) % modulus) * prev + dtype(a) * cur)),
+                     np.concatenate((cur, dtype(a) * prev + dtype(b) * cur)))
+    _NUMPY_BASES[modulus] = (prev, cur)
+    return prev, cur
+
+class FibonacciKeystream:
+    """
+    F(0), F(1), F(2)... anahtar akışını tek bir (a, b) çiftini ilerleterek üretir.
+
+    Tam sonuç veren yöntemlerde (memoized, iterative, matrix, fast_doubling, binet) her adım
+    tek bir toplama işlemidir. keystream_cap niteliği olan yöntemler (naive: F(min(i, 25)))
+    aynı yoldan ilerler ve cap pozisyonunda durur; diğer yöntemlerde her pozisyon için
+    yöntemin kendisi çağrılır, böylece şifreli çıktılar değişmez.
+    modulus verilirse değerler F(i) mod m olarak sabit genişlikte tutulur.
+    """
+
+    # Tüm n değerleri için gerçek F(n) değerini döndüren yöntemler
+    EXACT_METHODS = ('memoized_recursive', 'iterative', 'matrix_exponentiation', 'fast_doubling',
+                     'binet_formula', 'binet_exact')
+
+    def __init__(self, fib_method=None, start=0, incremental=True, modulus=None):
+        # incremental=False: yöntemi her pozisyonda çağırır (performans ölçümü için)
+        self.cap = getattr(fib_method, 'keystream_cap', None) if incremental else None
+        exact = incremental and (self.cap is not None or self.is_exact(fib_method))
+        self.fib_method = None if exact else fib_method
+        self.modulus = modulus
+        self.seek(start)
+
+    @classmethod
+    def is_exact(cls, fib_method):
+        """Yöntemin anahtar akışı ile aynı değerleri ürettiğini kontrol eder."""
+        if fib_method is None:
+            return True
+        fib_method = getattr(fib_method, '__wrapped__', fib_method)
+        return (isinstance(getattr(fib_method, '__self__', None), FibonacciMethods)
+                and getattr(fib_method, '__name__', None) in cls.EXACT_METHODS)
+
+    @profiled('fib_compute')
+    def seek(self, n):
+        """Akışı n. pozisyona taşır (fast doubling ile O(log n))."""
+        self.position = max(0, n)
+        if self.fib_method is None:
+            index = self.position if self.cap is None else min(self.position, self.cap)
+            values = get_shared_table().values
+            if index + 1 < len(values):
+                self.a, self.b = values[index], values[index + 1]
+                if self.modulus:
+                    self.a, self.b = self.a % self.modulus, self.b % self.modulus
+            elif self.modulus in (1 << 8, 1 << 32):
+                self.a, self.b = get_pisano_table(self.modulus.bit_length() - 1).pair(index)
+            else:
+                self.a, self.b = fibonacci_pair(index, self.modulus)
+
+    def vectorizable(self, count):
+        """
+        count sembollük blok NumPy ile üretilmeye değerse True döndürür (2^8 / 2^32 modülü,
+        en az NUMPY_MIN_BYTES anahtar baytı). NumPy yalnızca bu durumda yüklenir.
+        """
+        if self.fib_method is not None or self.cap is not None or self.modulus not in (1 << 8, 1 << 32):
+            return False
+        return count * ((self.modulus.bit_length() - 1) // 8) >= NUMPY_MIN_BYTES and _numpy_enabled()
+
+    @profiled('fib_compute', lambda self, count: count * ((self.modulus.bit_length() - 1) // 8))
+    def take(self, count):
+        """Sonraki count değeri tek bir NumPy dizisi olarak döndürür ve akışı ilerletir."""
+        prev, cur = _numpy_basis(self.modulus, count)
+        dtype = cur.dtype.type
+        block = dtype(self.a) * prev[:count] + dtype(self.b) * cur[:count]
+        self.seek(self.position + count)
+        return block
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.fib_method is not None:
+            value = self.fib_method(self.position)
+            if self.modulus:
+                value %= self.modulus
+        elif self.cap is not None and self.position >= self.cap:
+            value = self.a
+        elif self.modulus:
+            value = self.a
+            self.a, self.b = self.b, (self.a + self.b) % self.modulus
+        else:
+            value = self.a
+            self.a, self.b = self.b, self.a + self.b
+        self.position += 1
+        return value
+
 
 # Şifreleme ve şifre çözme fonksiyonları
-def encrypt(text, fib_method):
+@profiled('transform', lambda data, *args, **kwargs: len(data))
+def encrypt(text, fib_method, start=0, incremental=True):
     """Metni Fibonacci kullanarak şifrele."""
-    encrypted = []
-    for i, char in enumerate(text):
-        # Karakterin ASCII değeri + i. Fibonacci sayısı
-        fib_val = fib_method(i)
-        encrypted_val = ord(char) + fib_val
-        encrypted.append(encrypted_val)
-    return encrypted
-
-def decrypt(encrypted_values, fib_method):
+    keystream = FibonacciKeystream(fib_method, start, incremental)
+    # Karakterin ASCII değeri + i. Fibonacci sayısı
+    return [ord(char) + fib_val for char, fib_val in zip(text, keystream)]
+
+@profiled('transform', lambda data, *args, **kwargs: len(data))
+def decrypt(encrypted_values, fib_method, start=0, incremental=True):
     """Şifrelenmiş metni Fibonacci kullanarak çöz."""
-    decrypted = ""
-    for i, val in enumerate(encrypted_values):
-        # Şifrelenmiş değer - i. Fibonacci sayısı
-        fib_val = fib_method(i)
-        decrypted_val = val - fib_val
-        decrypted += chr(decrypted_val)
-    return decrypted
-
-def measure_performance(message, method_name, method_func):
-    """Belirli bir yöntemin performansını ölçer."""
-    # Garbage collector'ı kapatarak daha doğru sonuçlar alalım
+    keystream = FibonacciKeystream(fib_method, start, incremental)
+    # Şifrelenmiş değer - i. Fibonacci sayısı
+    return ''.join(chr(val - fib_val) for val, fib_val in zip(encrypted_values, keystream))
+
+# Sabit genişlikli (modüler) şifreleme modu
+CIPHER_MAGIC = b"FIBC"
+MODULAR_VERSION = 1
+MODULAR_WIDTHS = (8, 32)  # 8: UTF-8 baytı başına, 32: Unicode kod noktası başına
+_MODULAR_HEADER = struct.Struct("<4sBB")  # magic, sürüm, bit genişliği
+
+def _modular_symbols(text, bits):
+    """Metni seçilen genişlikteki sembollere (bayt veya kod noktası) ayırır."""
+    if bits not in MODULAR_WIDTHS:
+        raise ValueError(f"Desteklenmeyen genişlik: {bits} (desteklenen: {MODULAR_WIDTHS})")
+    if bits == 8:
+        return text.encode('utf-8')
+    return [ord(char) for char in text]
+
+def _vector_dtype(bits):
+    """Sembol genişliğine karşılık gelen küçük-sonlu NumPy veri tipi."""
+    return np.dtype('<u4') if bits == 32 else np.dtype(np.uint8)
+
+def _vector_symbols(text, bits):
+    """Metni NumPy sembol dizisine (UTF-8 baytları veya kod noktaları) çevirir."""
+    if bits == 8:
+        return np.frombuffer(text.encode('utf-8'), np.uint8)
+    return np.frombuffer(text.encode('utf-32-le'), _vector_dtype(32))
+
+def _vector_text(symbols, bits):
+    """NumPy sembol dizisini metne çevirir."""
+    return symbols.astype(_vector_dtype(bits), copy=False).tobytes().decode('utf-8' if bits == 8 else 'utf-32-le')
+
+def _vector_crypt(symbols, keystream, decrypt=False):
+    """Anahtar akışı bloğunu sembol dizisine tek işlemde uygular (uint taşması = mod 2^bits)."""
+    block = keystream.take(len(symbols))
+    return symbols - block if decrypt else symbols + block
+
+@profiled('transform', lambda data, *args, **kwargs: len(data))
+def encrypt_modular(text, fib_method, bits=32, start=0):
+    """
+    Metni F(i) mod 2^bits anahtar akışı ile şifreler.
+    Her sembol sabit genişlikte kalır; şifreli çıktı açık metinle aynı sayıda semboldür.
+    """
+    mask = (1 << bits) - 1
+    symbols = _modular_symbols(text, bits)
+    keystream = FibonacciKeystream(fib_method, start, modulus=mask + 1)
+    if keystream.vectorizable(len(text)):
+        return _vector_crypt(_vector_symbols(text, bits), keystream).tolist()
+    return [(symbol + fib_val) & mask for symbol, fib_val in zip(symbols, keystream)]
+
+@profiled('transform', lambda data, *args, **kwargs: len(data))
+def decrypt_modular(encrypted_values, fib_method, bits=32, start=0):
+    """encrypt_modular ile şifrelenmiş sembolleri metne geri çevirir."""
+    mask = (1 << bits) - 1
+    if bits not in MODULAR_WIDTHS:
+        raise ValueError(f"Desteklenmeyen genişlik: {bits} (desteklenen: {MODULAR_WIDTHS})")
+    keystream = FibonacciKeystream(fib_method, start, modulus=mask + 1)
+    if keystream.vectorizable(len(encrypted_values)):
+        values = np.asarray(encrypted_values, dtype=_vector_dtype(bits))
+        return _vector_text(_vector_crypt(values, keystream, decrypt=True), bits)
+    symbols = [(val - fib_val) & mask for val, fib_val in zip(encrypted_values, keystream)]
+    if bits == 8:
+        return bytes(symbols).decode('utf-8')
+    return ''.join(map(chr, symbols))
+
+def _word_array(bits, values=()):
+    """Sembolleri sabit genişlikli bir diziye koyar."""
+    typecode = 'B' if bits == 8 else next(t for t in ('I', 'L') if array(t).itemsize == 4)
+    return array(typecode, values)
+
+@profiled('serialization', lambda values, bits: len(values) * bits // 8)
+def _words_to_bytes(values, bits):
+    """Sembolleri küçük-sonlu (little-endian) baytlara çevirir."""
+    words = _word_array(bits, values)
+    if sys.byteorder != 'little':
+        words.byteswap()
+    return words.tobytes()
+
+@profiled('serialization', lambda data, *args, **kwargs: len(data))
+def _bytes_to_words(data, bits):
+    """Küçük-sonlu baytları sembol dizisine çevirir."""
+    words = _word_array(bits)
+    words.frombytes(data)
+    if sys.byteorder != 'little':
+        words.byteswap()
+    return words
+
+def _read_modular_header(data):
+    """Modüler başlığı doğrular ve bit genişliğini döndürür."""
+    magic, version, bits = _MODULAR_HEADER.unpack_from(data)
+    if magic != CIPHER_MAGIC:
+        raise ValueError("Geçersiz şifreli dosya başlığı")
+    if version not in (MODULAR_VERSION, BINARY_VERSION):
+        raise ValueError(f"Desteklenmeyen şifreli dosya sürümü: {version}")
+    if bits not in MODULAR_WIDTHS:
+        raise ValueError(f"Desteklenmeyen genişlik: {bits} (desteklenen: {MODULAR_WIDTHS})")
+    return bits
+
+def pack_modular(values, bits):
+    """Modüler şifreli sembolleri başlık + sabit genişlikli gövde olarak paketler."""
+    return _MODULAR_HEADER.pack(CIPHER_MAGIC, MODULAR_VERSION, bits) + _words_to_bytes(values, bits)
+
+def unpack_modular(data):
+    """pack_modular çıktısını (bits, semboller) olarak çözer."""
+    bits = _read_modular_header(data)
+    return bits, _bytes_to_words(data[_MODULAR_HEADER.size:], bits)
+
+# İkili (bayt tabanlı) şifreleme modu
+BINARY_VERSION = 2
+_BINARY_HEADER = struct.Struct("<4sBBBQ")  # magic, sürüm, bit genişliği, yöntem kimliği, orijinal uzunluk
+UNKNOWN_LENGTH = 0xFFFFFFFFFFFFFFFF  # akış şifrelemede uzunluk bilinmiyorsa
+FIB_METHOD_IDS = {'naive': 1, 'memoized': 2, 'iterative': 3, 'matrix': 4, 'binet': 5, 'fast_doubling': 6}
+
+@profiled('transform', lambda data, *args, **kwargs: len(data))
+def _crypt_bytes(data, keystream, decrypt=False):
+    """Bayt dizisine F(i) mod 256 anahtar akışını uygular."""
+    if keystream.vectorizable(len(data)):
+        return _vector_crypt(np.frombuffer(data, np.uint8), keystream, decrypt).tobytes()
+    if (keystream.fib_method is None and keystream.cap is None and keystream.modulus == 256
+            and len(data) >= 4 * 384):
+        return _crypt_bytes_pisano(data, keystream, decrypt)
+    if decrypt:
+        return bytes((byte - fib_val) & 0xFF for byte, fib_val in zip(data, keystream))
+    return bytes((byte + fib_val) & 0xFF for byte, fib_val in zip(data, keystream))
+
+# out verildiğinde Pisano yolunun kullandığı, önbellekte kalan karalama bloğu (periyodun katı)
+PISANO_BLOCK = 384 * 4096  # bayt
+
+def _pisano_fill(target, source, offset, decrypt):
+    """
+    source baytlarını (bytes, bytearray veya memoryview) offset kalıntısından başlayarak
+    dönüştürüp target bytearray'ine yazar.
+    """
+    table = get_pisano_table(8)
+    values, period = table.values, table.period
+    if isinstance(source, memoryview):
+        for j in range(period):
+            target[j::period] = source[j::period].tobytes().translate(
+                _shift_table(values[(offset + j) % period], decrypt))
+        return
+    for j in range(period):
+        target[j::period] = source[j::period].translate(_shift_table(values[(offset + j) % period], decrypt))
+
+def _crypt_bytes_pisano(data, keystream, decrypt=False, out=None):
+    """
+    F(i) mod 256 periyodu 384 olduğundan i ≡ j (mod 384) pozisyonlarının hepsi
+    aynı anahtar baytını kullanır: her kalıntı sınıfı tek bir adımlı dilim ve
+    bytes.translate ile dönüştürülür. out (yazılabilir bayt görünümü) verilirse
+    sonuç PISANO_BLOCK'luk tek bir karalama tamponu üzerinden doğrudan oraya
+    yazılır ve None döner (adımlı atama bytearray'e memoryview'e göre çok daha hızlıdır).
+    """
+    view = data if isinstance(data, (bytes, bytearray)) else memoryview(data)
+    offset = keystream.position % get_pisano_table(8).period
+    if out is None:
+        target = bytearray(len(data))
+        _pisano_fill(target, view, offset, decrypt)
+    else:
+        scratch = bytearray(min(PISANO_BLOCK, len(data)))
+        for start in range(0, len(data), PISANO_BLOCK):
+            chunk = view[start:start + PISANO_BLOCK]
+            if len(chunk) != len(scratch):
+                scratch = bytearray(len(chunk))
+            _pisano_fill(scratch, chunk, offset, decrypt)
+            out[start:start + len(chunk)] = scratch
+    keystream.seek(keystream.position + len(data))
+    return bytes(target) if out is None else None
+
+@profiled('transform', lambda src, *args, **kwargs: len(src))
+def _crypt_bytes_into(src, dst, keystream, decrypt=False):
+    """
+    _crypt_bytes sonucunu yazılabilir dst görünümüne (ör. mmap penceresi) doğrudan
+    yazar: NumPy yolu out= ile, Pisano yolu adımlı dilim atamasıyla çalışır.
+    src ve dst aynı bellek olabilir (yerinde dönüşüm).
+    """
+    if keystream.vectorizable(len(src)):
+        operation = np.subtract if decrypt else np.add
+        operation(np.frombuffer(src, np.uint8), keystream.take(len(src)), out=np.frombuffer(dst, np.uint8))
+    elif (keystream.fib_method is None and keystream.cap is None and keystream.modulus == 256
+            and len(src) >= 4 * 384):
+        _crypt_bytes_pisano(src, keystream, decrypt, out=dst)
+    else:
+        dst[:] = _crypt_bytes(src, keystream, decrypt)
+
+def encrypt_bytes(data, fib_method, start=0):
+    """bytes/bytearray/memoryview verisini bayt başına F(i) mod 256 ile şifreler."""
+    return _crypt_bytes(data, FibonacciKeystream(fib_method, start, modulus=256))
+
+def decrypt_bytes(data, fib_method, start=0):
+    """encrypt_bytes ile şifrelenmiş veriyi çözer."""
+    return _crypt_bytes(data, FibonacciKeystream(fib_method, start, modulus=256), decrypt=True)
+
+def pack_binary(data, fib_method, method_name='iterative'):
+    """Veriyi şifreler ve yöntem, sürüm ve orijinal uzunluğu içeren başlıkla paketler."""
+    header = _BINARY_HEADER.pack(CIPHER_MAGIC, BINARY_VERSION, 8,
+                                 FIB_METHOD_IDS.get(method_name, 0), len(data))
+    return header + encrypt_bytes(data, fib_method)
+
+@profiled('serialization')
+def read_cipher_header(src, head=b''):
+    """
+    Akışın başındaki şifreli dosya başlığını okur.
+    Başlık bilgilerini sözlük olarak döndürür; dosya başlıksızsa (eski ondalık
+    biçim) None ve okunan baytları döndürür.
+    """
+    head += src.read(_MODULAR_HEADER.size - len(head))
+    if not head.startswith(CIPHER_MAGIC):
+        return None, head
+    bits = _read_modular_header(head)
+    header = {"version": head[4], "bits": bits, "method": None, "length": None}
+    if header["version"] == BINARY_VERSION:
+        head += src.read(_BINARY_HEADER.size - len(head))
+        if len(head) < _BINARY_HEADER.size:
+            raise ValueError("Şifreli dosya başlığı eksik")
+        _, _, _, method_id, length = _BINARY_HEADER.unpack(head)
+        method_names = {v: k for k, v in FIB_METHOD_IDS.items()}
+        header["method"] = method_names.get(method_id)
+        header["length"] = None if length == UNKNOWN_LENGTH else length
+    return header, head
+
+# naive yönteminin hesapladığı en büyük indeks (daha büyük i için F(25) kullanılır)
+NAIVE_CAP = 25
+
+def get_fib_method(fib, name, shared=True, n=None):
+    """
+    Yöntem adına karşılık gelen Fibonacci fonksiyonunu döndürür.
+    shared=True ise tam sonuç veren yöntemler paylaşılan tablodan okunur.
+    name='auto' ise AUTO_METHOD kullanılır (bkz. resolve_method).
+    """
+    name = resolve_method(name, n)
+    if name == 'naive':
+        def naive(n):
+            return fib.naive_recursive(min(n, NAIVE_CAP))
+        # Anahtar akışı F(min(i, 25)) dizisini artımlı üretir; yöntem her baytta çağrılmaz
+        naive.keystream_cap = NAIVE_CAP
+        return naive
+    method_func = {
+        'memoized': fib.memoized_recursive,
+        'iterative': fib.iterative,
+        'matrix': fib.matrix_exponentiation,
+        'binet': fib.binet_formula,
+        'fast_doubling': fib.fast_doubling
+    }.get(name, fib.iterative)
+    return with_shared_table(method_func) if shared else method_func
+
+# Performans ölçüm düzeneği: ısınma + tekrarlı ölçüm (perf_counter_ns), bellek ayrı geçişte
+BENCHMARK_SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+BENCHMARK_ENGINES = ('naive', 'memoized', 'iterative', 'matrix', 'binet', 'fast_doubling')
+# Belirli bir boyutun üzerinde çalıştırılması pratik olmayan yöntemler (üstel süre / O(n^2) bellek)
+BENCHMARK_ENGINE_LIMITS = {'naive': 25, 'memoized': 10000}
+# Ondalık biçimde i. sayı F(i) kadar büyüdüğünden şifreli metin O(n^2) bit yer kaplar
+BENCHMARK_CIPHER_LIMITS = {'decimal': 10000}
+
+def _percentile(ordered, fraction):
+    """Sıralı örneklerde doğrusal enterpolasyonlu yüzdelik değeri döndürür."""
+    position = (len(ordered) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+def summarize_samples(samples):
+    """Nanosaniye örneklerinden medyan, p95, ortalama ve standart sapma hesaplar."""
+    ordered = sorted(samples)
+    count = len(ordered)
+    mean = sum(ordered) / count
+    variance = sum((x - mean) ** 2 for x in ordered) / (count - 1) if count > 1 else 0.0
+    return {
+        "count": count,
+        "min_ns": ordered[0],
+        "median_ns": _percentile(ordered, 0.5),
+        "p95_ns": _percentile(ordered, 0.95),
+        "mean_ns": mean,
+        "stdev_ns": math.sqrt(variance),
+        "max_ns": ordered[-1]
+    }
+
+def time_call(func, warmup=2, repeat=11, max_time_ns=2 * 10**9):
+    """
+    func'u warmup kez ısındırıp en fazla repeat kez perf_counter_ns ile ölçer.
+    Ölçüm sırasında çöp toplayıcı kapalıdır ve tracemalloc çalışmaz. Toplam süre
+    max_time_ns'i aşarsa (en az 3 örnekten sonra) ölçüm erken biter.
+    """
+    for _ in range(warmup):
+        func()
+    gc.collect()
+    gc_enabled = gc.isenabled()
     gc.disable()
-    
-    # Hafıza kullanımını izlemeye başla
+    samples = []
+    try:
+        budget = time.perf_counter_ns() + max_time_ns
+        for _ in range(repeat):
+            started = time.perf_counter_ns()
+            func()
+            finished = time.perf_counter_ns()
+            samples.append(finished - started)
+            if finished > budget and len(samples) >= 3:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return summarize_samples(samples)
+
+def measure_memory(func):
+    """func'u tracemalloc altında tek kez çalıştırır; (anlık, tepe) bayt değerlerini döndürür."""
+    import tracemalloc
+    gc.collect()
     tracemalloc.start()
-    
-    # Zamanı başlat
-    start_time = time.time()
-    
-    # Şifrele
-    encrypted = encrypt(message, method_func)
-    
-    # Şifreyi çöz
-    decrypted = decrypt(encrypted, method_func)
-    
-    # Zamanı durdur
-    end_time = time.time()
-    execution_time = end_time - start_time
-    
-    # Hafıza kullanımını ölç
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    
-    # Garbage collector'ı yeniden etkinleştir
-    gc.enable()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+# Süreç belleği (RSS): izleme yükü olmadan, zamanlamadan ayrı bir geçişte örneklenir
+RSS_SAMPLE_INTERVAL = 0.001  # saniye
+
+def _proc_status(field):
+    """/proc/self/status içindeki bir kB alanını (VmRSS, VmHWM) bayt olarak döndürür; yoksa None."""
+    try:
+        with open('/proc/self/status', 'rb') as f:
+            for line in f:
+                if line.startswith(field.encode('ascii') + b':'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def current_rss():
+    """Anlık RSS'i bayt olarak döndürür (/proc/self/statm; Linux dışında None)."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+def peak_rss():
+    """Sürecin şimdiye kadarki tepe RSS'i (bayt); resource modülü yoksa (Windows) None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _reset_peak_rss():
+    """Linux'ta VmHWM tepe değerini anlık RSS'e sıfırlar; başarılıysa True döndürür."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def measure_rss(func, interval=RSS_SAMPLE_INTERVAL):
+    """
+    func'u tracemalloc olmadan tek kez çalıştırır ve süreç belleğini ölçer.
+    Linux'ta VmHWM sıfırlanıp çağrı boyunca bir iş parçacığı RSS'i örnekler;
+    /proc yoksa getrusage tepe değeri kullanılır (yalnızca yeni bir tepe oluşursa artar).
+    Baytlar: rss_before, rss_after, rss_peak, rss_peak_delta; source ölçüm kaynağıdır.
+    """
+    gc.collect()
+    before = current_rss()
+    if before is None:
+        peak_before = peak_rss()
+        func()
+        peak_after = peak_rss()
+        return {"source": "getrusage" if peak_after is not None else None,
+                "rss_before": None, "rss_after": None, "rss_peak": peak_after,
+                "rss_peak_delta": None if peak_after is None else peak_after - peak_before}
+
+    hwm_reset = _reset_peak_rss()
+    samples = [before]
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(interval):
+            value = current_rss()
+            if value is not None:
+                samples.append(value)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        func()
+    finally:
+        stop.set()
+        sampler.join()
+    after = current_rss()
+    samples.append(after)
+    hwm = _proc_status('VmHWM') if hwm_reset else None
+    peak = max(samples + ([hwm] if hwm else []))
+    return {"source": "proc", "rss_before": before, "rss_after": after, "rss_peak": peak,
+            "rss_peak_delta": peak - before}
+
+def engine_memory_breakdown(engine, n, top=3):
+    """
+    Yeni bir FibonacciMethods örneğiyle F(n) hesaplar ve örnek canlıyken
+    tracemalloc anlık görüntüsünü kalemlere ayırır: sonuç tamsayısı, self.memo'da
+    tutulan büyük tamsayılar ve kayıt yapısı, çağrı sonrası tutulan toplam ve
+    çağrı sırasındaki tepe. En çok bayt tutan top ayırma satırı da döndürülür.
+    Ardışık memo çiftleri aynı tamsayı nesnelerini paylaştığından memo_bytes
+    benzersiz nesneler üzerinden sayılır (FibonacciMemo.total_bytes bunları iki kez sayar).
+    """
+    import tracemalloc
+    fib = FibonacciMethods()
+    method = get_fib_method(fib, engine, shared=False)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = method(n)
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    memo = fib.memo
+    memo_values = {id(value): value for pair in memo.entries.values() for value in pair}
+    sites = snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),)).statistics('lineno')
+    return {
+        "engine": engine,
+        "n": n,
+        "result_bytes": sys.getsizeof(result),
+        "memo_entries": len(memo),
+        "memo_bytes": sum(map(sys.getsizeof, memo_values.values())),
+        "memo_overhead_bytes": sys.getsizeof(memo.entries) + sum(map(sys.getsizeof, memo.entries.values())),
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+        "top_sites": [{"site": f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                       "bytes": stat.size, "count": stat.count} for stat in sites[:top]],
+    }
+
+MEMORY_SIZES = (1000, 10000, 100000)
+
+def benchmark_memory(sizes=MEMORY_SIZES, engines=BENCHMARK_ENGINES):
+    """
+    Her yöntem ve boyut için RSS ölçümünü ve tracemalloc dökümünü ayrı geçişlerde
+    alır. RSS önce ölçülür; böylece döküm geçişinin serbest bıraktığı bellek
+    yeniden kullanılıp büyümeyi gizlemez. BENCHMARK_ENGINE_LIMITS sınırını aşan boyutlar atlanır.
+    """
+    results = []
+    for engine in engines:
+        for n in sizes:
+            limit = BENCHMARK_ENGINE_LIMITS.get(engine)
+            if limit is not None and n > limit:
+                results.append({"engine": engine, "n": n, "skipped": True})
+                continue
+            rss = measure_rss(lambda: get_fib_method(FibonacciMethods(), engine, shared=False)(n))
+            row = engine_memory_breakdown(engine, n)
+            row.update(rss)
+            results.append(row)
+    return results
+
+def measure_performance(message, method_name, method_func, warmup=2, repeat=11):
+    """
+    Belirli bir yöntemin şifreleme + çözme performansını ölçer.
+    Süre ısınma turlarından sonra tekrarlı ölçümlerin medyanıdır; tracemalloc
+    belleği ve süreç RSS'i, izleme yükü süreye karışmasın diye ayrı geçişlerde ölçülür.
+    """
+    def round_trip():
+        # Algoritmaları karşılaştırmak için her pozisyonda yöntemi çağır
+        return decrypt(encrypt(message, method_func, incremental=False), method_func, incremental=False)
     
     # Şifre çözümünün doğruluğunu kontrol et
-    is_correct = (decrypted == message)
+    is_correct = (round_trip() == message)
+    timing = time_call(round_trip, warmup, repeat)
+    rss = measure_rss(round_trip)
+    current, peak = measure_memory(round_trip)
     
     return {
         "method": method_name,
-        "time": execution_time,
+        "time": timing["median_ns"] / 1e9,
+        "p95": timing["p95_ns"] / 1e9,
+        "stdev": timing["stdev_ns"] / 1e9,
+        "samples": timing["count"],
         "memory_current": current / 1024,  # KB
         "memory_peak": peak / 1024,  # KB
+        "rss_peak_delta": None if rss["rss_peak_delta"] is None else rss["rss_peak_delta"] / 1024,  # KB
         "correct": is_correct
     }
 
+def benchmark_engines(sizes=BENCHMARK_SIZES, engines=BENCHMARK_ENGINES, max_call_ns=10**9):
+    """
+    Her yöntemin tek bir F(n) hesabını verilen n boyutlarında ölçer. Her denemede
+    yeni bir FibonacciMethods örneği kullanılır (önbellekler soğuk başlar).
+    Bir sonraki boyut için tahmini süre (n^2 büyüme) max_call_ns'i aşarsa
+    veya BENCHMARK_ENGINE_LIMITS sınırı geçilirse boyut atlanır.
+    """
+    results = []
+    for engine in engines:
+        previous = None
+        for n in sizes:
+            row = {"engine": engine, "n": n}
+            limit = BENCHMARK_ENGINE_LIMITS.get(engine)
+            if (limit is not None and n > limit) or \
+                    (previous and previous["median_ns"] * (n / previous["n"]) ** 2 > max_call_ns):
+                row["skipped"] = True
+                results.append(row)
+                continue
+            
+            def call(engine=engine, n=n):
+                return get_fib_method(FibonacciMethods(), engine, shared=False)(n)
+            row.update(time_call(call, warmup=1, repeat=7, max_time_ns=max_call_ns))
+            row["memory_current"], row["memory_peak"] = measure_memory(call)
+            previous = row
+            results.append(row)
+    return results
+
+def _cipher_round_trips(n, rng):
+    """Boyutu n olan girdiler için şifreleme biçimlerinin gidiş-dönüş fonksiyonlarını döndürür."""
+    text = ''.join(rng.choice(string.ascii_letters + string.digits + ' ') for _ in range(n))
+    data = bytes(rng.getrandbits(8) for _ in range(n))
+    return {
+        "decimal": lambda: decrypt(encrypt(text, None), None),
+        "modular32": lambda: decrypt_modular(encrypt_modular(text, None, 32), None, 32),
+        "binary": lambda: decrypt_bytes(encrypt_bytes(data, None), None),
+    }
+
+def benchmark_cipher(sizes=BENCHMARK_SIZES, max_time_ns=10**9):
+    """
+    Tam şifreleme + çözme yolunu biçim başına verilen mesaj boyutlarında ölçer.
+    BENCHMARK_CIPHER_LIMITS sınırını aşan boyutlar atlanır.
+    """
+    rng = random.Random(0)
+    results = []
+    for n in sizes:
+        for path, func in _cipher_round_trips(n, rng).items():
+            row = {"path": path, "n": n}
+            limit = BENCHMARK_CIPHER_LIMITS.get(path)
+            if limit is not None and n > limit:
+                row["skipped"] = True
+                results.append(row)
+                continue
+            row.update(time_call(func, warmup=1, repeat=9, max_time_ns=max_time_ns))
+            row["memory_current"], row["memory_peak"] = measure_memory(func)
+            results.append(row)
+    return results
+
+# Ölçeklenme testi: geometrik boyutlarda ölçüm, log-log eğim (ampirik üs) ve temel çizgi karşılaştırması
+SCALING_SIZES = tuple(int(round(10 ** (k / 2))) for k in range(2, 13))  # 10, 32, 100 ... 10^6
+SCALING_FILE_VERSION = 1
+SCALING_MIN_COMPARE_NS = 10**6  # bu sürenin altındaki noktalar gürültü nedeniyle karşılaştırılmaz
+
+def fit_exponent(points):
+    """
+    (n, medyan_ns) noktalarına log-log en küçük kareler doğrusu uydurur.
+    Süre ≈ c · n^k için (k, c) döndürür; ikiden az nokta varsa (None, None).
+    """
+    points = [(math.log(n), math.log(t)) for n, t in points if n > 0 and t > 0]
+    if len(points) < 2:
+        return None, None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if not sxx:
+        return None, None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+    return slope, math.exp(mean_y - slope * mean_x)
+
+def _scaling_series(rows, key):
+    """
+    benchmark_* satırlarını seri adı -> {exponent, coefficient, points} sözlüğüne çevirir.
+    Üs, SCALING_MIN_COMPARE_NS üzerindeki noktalardan (en az iki tane varsa) hesaplanır.
+    """
+    series = {}
+    for row in rows:
+        entry = series.setdefault(row[key], {"points": []})
+        if not row.get("skipped"):
+            entry["points"].append({name: row[name] for name in ("n", "min_ns", "median_ns", "p95_ns", "stdev_ns")})
+    for entry in series.values():
+        # Asimptotik üs için sabit ek yükün baskın olduğu küçük süreler dışarıda bırakılır
+        points = [(point["n"], point["median_ns"]) for point in entry["points"]]
+        large = [point for point in points if point[1] >= SCALING_MIN_COMPARE_NS]
+        entry["exponent"], entry["coefficient"] = fit_exponent(large if len(large) >= 2 else points)
+        entry["fit_points"] = len(large)
+    return series
+
+def _calibration_ns():
+    """
+    Sabit bir saf Python iş yükünün medyan süresi. Karşılaştırmada oranlar bu
+    değerle normalize edilir; böylece makinenin o anki genel hızındaki kayma
+    (frekans ölçekleme, komşu yükler) gerileme sayılmaz.
+    """
+    return time_call(lambda: sum(i * i for i in range(200000)), warmup=2, repeat=15)["median_ns"]
+
+def run_scaling_benchmark(sizes=SCALING_SIZES, engines=BENCHMARK_ENGINES):
+    """Yöntemleri ve tam şifreleme yolunu geometrik boyutlarda ölçer; JSON'a yazılabilir sözlük döndürür."""
+    return {
+        "version": SCALING_FILE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration_ns": _calibration_ns(),
+        "sizes": list(sizes),
+        "engines": _scaling_series(benchmark_engines(sizes, engines), "engine"),
+        "cipher": _scaling_series(benchmark_cipher(sizes), "path"),
+    }
+
+def compare_scaling(current, baseline, threshold=0.5):
+    """
+    Ölçümleri temel çizgiyle karşılaştırır. Ortak her noktada hem medyan hem en
+    iyi (min) süre (1 + threshold) katından fazla artmışsa, ya da en az üç noktadan
+    uydurulan ampirik üs threshold'dan fazla büyümüşse bir gerileme kaydı döndürür.
+    Medyan ile birlikte min'in de aranması ve oranların kalibrasyon iş yüküyle
+    normalize edilmesi, yalnızca gürültüden kaynaklanan yanlış alarmları önler.
+    """
+    regressions = []
+    # Makine hızı kayması: kalibrasyon iş yükünün süre oranı
+    speed = 1.0
+    if current.get("calibration_ns") and baseline.get("calibration_ns"):
+        speed = current["calibration_ns"] / baseline["calibration_ns"]
+    for group in ("engines", "cipher"):
+        for name, series in current.get(group, {}).items():
+            base = baseline.get(group, {}).get(name)
+            if not base:
+                continue
+            base_points = {point["n"]: point for point in base["points"]}
+            for point in series["points"]:
+                old = base_points.get(point["n"])
+                if not old or old["median_ns"] < SCALING_MIN_COMPARE_NS:
+                    continue
+                ratio = point["median_ns"] / old["median_ns"] / speed
+                best_ratio = point.get("min_ns", point["median_ns"]) / old.get("min_ns", old["median_ns"]) / speed
+                if min(ratio, best_ratio) > 1 + threshold:
+                    regressions.append({"group": group, "name": name, "n": point["n"], "kind": "time",
+                                        "baseline": old["median_ns"], "current": point["median_ns"],
+                                        "ratio": ratio})
+            if series["exponent"] is not None and base.get("exponent") is not None \
+                    and min(series.get("fit_points", 0), base.get("fit_points", 0)) >= 3 \
+                    and series["exponent"] - base["exponent"] > threshold:
+                regressions.append({"group": group, "name": name, "n": None, "kind": "exponent",
+                                    "baseline": base["exponent"], "current": series["exponent"],
+                                    "ratio": series["exponent"] / base["exponent"] if base["exponent"] else None})
+    return regressions
+
+# 'auto' yöntem adı: tam sonuç veren tüm motorlar aynı artımlı anahtar akışını, şifre
+# planları da paylaşılan tabloyu kullandığından motor seçimi verimi değiştirmez;
+# 'auto' doğrudan F(n) hesabında en öngörülebilir motor olan fast_doubling'e karşılık gelir
+AUTO_METHOD = 'fast_doubling'
+FIB_METHOD_CHOICES = tuple(FIB_METHOD_IDS) + ('auto',)
+
+def resolve_method(name, n=None):
+    """
+    'auto' yöntem adını AUTO_METHOD'a çevirir; diğer adları olduğu gibi döndürür.
+    Başlıklara ve manifestlere çözülmüş ad yazılır. n yalnızca çağıranlarla uyum için vardır.
+    """
+    return AUTO_METHOD if name == 'auto' else name
+
+def measure_engines(n, engines=BENCHMARK_ENGINES):
+    """
+    Motorları tek bir n için doğrular ve ölçer (--optimal ekranı için; sonuç saklanmaz).
+    {"winner": en hızlı doğru motor, "engines": motor -> kayıt} döndürür.
+    """
+    expected = fibonacci_pair(n)[0]
+    results = {}
+    for engine in engines:
+        entry = {"correct": False}
+        results[engine] = entry
+        engine_limit = BENCHMARK_ENGINE_LIMITS.get(engine)
+        if engine_limit is not None and n > engine_limit:
+            entry["skipped"] = "limit"
+            continue
+        method = get_fib_method(FibonacciMethods(), engine, shared=False)
+        try:
+            entry["correct"] = method(n) == expected
+        except (ArithmeticError, RecursionError, ValueError):
+            pass
+        if entry["correct"]:
+            timing = time_call(lambda: method(n), warmup=1, repeat=5)
+            entry.update(n=n, median_ns=timing["median_ns"], p95_ns=timing["p95_ns"])
+    measured = [name for name, entry in results.items() if entry.get("median_ns")]
+    winner = min(measured, key=lambda name: results[name]["median_ns"]) if measured else AUTO_METHOD
+    return {"winner": winner, "engines": results}
+
 # Şifre oluşturma (password generator) fonksiyonları
 def generate_password_simple(length=12):
     """
@@ -215,234 +1459,324 @@ def generate_password_simple(length=12):
     password = ''.join(random.choice(chars) for _ in range(length))
     return password
 
-def generate_password_fibonacci(length=12, method='iterative'):
+# Karakter havuzları (Fibonacci sayısının 4'e göre kalanı ile seçilir)
+PASSWORD_CHAR_POOLS = (
+    string.ascii_lowercase,
+    string.ascii_uppercase,
+    string.digits,
+    string.punctuation
+)
+_DIGITS = frozenset(string.digits)
+_PUNCTUATION = frozenset(string.punctuation)
+
+@functools.lru_cache(maxsize=64)
+@profiled('fib_compute')
+def _password_plan(length, method):
     """
-    Fibonacci tabanlı şifre oluşturucu - karakter seçiminde Fibonacci sayılarını kullanır.
+    Her pozisyon için (karakter havuzu, fib_val + i) çiftlerini hesaplar.
+    Bu kısım yalnızca uzunluk ve yönteme bağlı olduğundan bir kez hesaplanır.
     """
-    fib = FibonacciMethods()
-    
-    # Kullanılacak Fibonacci metodu
-    method_func = {
-        'naive': lambda n: fib.naive_recursive(min(n, 25)),
-        'memoized': fib.memoized_recursive,
-        'iterative': fib.iterative,
-        'matrix': fib.matrix_exponentiation,
-        'binet': fib.binet_formula
-    }.get(method, fib.iterative)
-    
-    # Karakter havuzları
-    chars = {
-        'lowercase': string.ascii_lowercase,
-        'uppercase': string.ascii_uppercase,
-        'digits': string.digits,
-        'special': string.punctuation
-    }
-    
-    password = ""
-    
-    # Benzersiz şifre oluşturmak için farklı bir seed kullan
-    current_time = time.time()
-    random.seed(current_time + random.random())
-    
-    # Her bir karakter için, indekse göre bir Fibonacci sayısı hesapla
-    # ve bu sayıyı karakter seçiminde kullan
+    method_func = get_fib_method(FibonacciMethods(), method)
+    plan = []
     for i in range(length):
-        # Fibonacci sayısını hesapla
         fib_val = method_func(i + 1)
-        
-        # Karakter tipini belirle (fib_val % 4)
-        char_type = list(chars.keys())[fib_val % 4]
-        
-        # Karakter havuzundan rastgele bir karakter seç
-        # Fibonacci sayısını ve pozisyonu kullanarak karakteri seç
-        char_pool = chars[char_type]
-        char_index = (fib_val + i + int(current_time * 1000) % 100) % len(char_pool)
-        char = char_pool[char_index]
-        
-        # Şifreye karakteri ekle
-        password += char
-    
-    # Şifrede en az bir rakam ve özel karakter olduğundan emin ol
-    if not any(c in string.digits for c in password):
+        plan.append((PASSWORD_CHAR_POOLS[fib_val % 4], fib_val + i))
+    return tuple(plan)
+
+class EntropySource:
+    """
+    Kriptografik olarak güvenli (os.urandom) rastgelelik kaynağı.
+    Baytlar büyük bloklar halinde okunup tamponlanır ve yeniden seed
+    gerektirmeden tüketilir; tampon erişimi iş parçacıkları arasında kilitlidir.
+    fork ile oluşan süreçler ebeveynin tamponunu devralmaz: süreç kimliği
+    değiştiğinde tampon atılır, böylece ebeveyn ve çocuk aynı baytları üretmez.
+    """
+
+    def __init__(self, block_size=64 * 1024, source=os.urandom):
+        self.block_size = block_size
+        self._source = source
+        self._tables = {}
+        self._reset()
+
+    def _reset(self):
+        """Tamponu ve kilidi sıfırlar (fork sonrası çocuk süreçte çağrılır)."""
+        self._buffer = b''
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def randbytes(self, n):
+        """n adet rastgele bayt döndürür."""
+        if self._pid != os.getpid():
+            self._reset()
+        with self._lock:
+            if self._pos + n > len(self._buffer):
+                self._buffer = self._buffer[self._pos:] + self._source(max(self.block_size, n))
+                self._pos = 0
+            data = self._buffer[self._pos:self._pos + n]
+            self._pos += n
+        return data
+
+    def randbelow_bytes(self, n, count):
+        """[0, n) aralığında count adet yansız değeri bayt dizisi olarak döndürür (n <= 256)."""
+        if not 0 < n <= 256:
+            raise ValueError("n 1 ile 256 arasında olmalı")
+        tables = self._tables.get(n)
+        if tables is None:
+            # 256 % n fazlalığı reddedilir, kalan baytlar mod n ile eşlenir
+            tables = self._tables[n] = (bytes(i % n for i in range(256)), bytes(range(256 - 256 % n, 256)))
+        table, reject = tables
+        result = b''
+        while len(result) < count:
+            need = count - len(result)
+            result += self.randbytes(need + need // 4 + 16).translate(table, reject)
+        return result[:count]
+
+    def randbelow(self, n):
+        """[0, n) aralığında yansız bir tamsayı döndürür."""
+        if n <= 0:
+            raise ValueError("n pozitif olmalı")
+        if n <= 256:
+            return self.randbelow_bytes(n, 1)[0]
+        bits = n.bit_length()
+        nbytes = (bits + 7) // 8
+        while True:
+            value = int.from_bytes(self.randbytes(nbytes), 'little') >> (nbytes * 8 - bits)
+            if value < n:
+                return value
+
+    def randint(self, a, b):
+        """[a, b] aralığında bir tamsayı döndürür."""
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, seq):
+        """Diziden rastgele bir eleman seçer."""
+        return seq[self.randbelow(len(seq))]
+
+
+# Varsayılan, işlem genelinde paylaşılan rastgelelik kaynağı
+DEFAULT_ENTROPY = EntropySource()
+if hasattr(os, 'register_at_fork'):
+    # fork anında başka bir iş parçacığının tuttuğu kilit çocukta da serbest başlar
+    os.register_at_fork(after_in_child=DEFAULT_ENTROPY._reset)
+
+def _ensure_digit_and_special(chars, entropy):
+    """Şifrede en az bir rakam ve bir özel karakter olduğundan emin olur (yerinde)."""
+    if _DIGITS.isdisjoint(chars):
         # Rastgele bir pozisyona bir rakam ekle
-        pos = random.randint(0, length - 1)
-        password = password[:pos] + random.choice(string.digits) + password[pos+1:]
-    
-    if not any(c in string.punctuation for c in password):
+        chars[entropy.randint(0, len(chars) - 1)] = entropy.choice(string.digits)
+    if _PUNCTUATION.isdisjoint(chars):
         # Rastgele bir pozisyona bir özel karakter ekle
-        pos = random.randint(0, length - 1)
-        password = password[:pos] + random.choice(string.punctuation) + password[pos+1:]
-    
-    return password
+        chars[entropy.randint(0, len(chars) - 1)] = entropy.choice(string.punctuation)
+
+def generate_password_fibonacci(length=12, method='iterative', entropy=None):
+    """
+    Fibonacci tabanlı şifre oluşturucu - karakter seçiminde Fibonacci sayılarını kullanır.
+    """
+    return next(generate_password_batches(1, length, method, entropy=entropy))[0]
+
+@functools.lru_cache(maxsize=64)
+def _password_columns(length, method):
+    """
+    Her pozisyon için (havuz uzunluğu, indeks -> karakter çeviri tablosu) döndürür.
+    Havuz fib_val + i kadar döndürülür; böylece karakter = havuz[(fib_val + i + r) % len].
+    Ayrıca rakam veya özel karakter düzeltmesinin gerekip gerekmediğini döndürür.
+    """
+    columns = []
+    pools = ''
+    for pool, base in _password_plan(length, method):
+        shift = base % len(pool)
+        columns.append((len(pool), (pool[shift:] + pool[:shift]).encode('ascii').ljust(256, b'\0')))
+        pools += pool
+    needs_fixup = _DIGITS.isdisjoint(pools) or _PUNCTUATION.isdisjoint(pools)
+    return tuple(columns), needs_fixup
+
+def generate_password_batches(count, length=12, method='iterative', batch_size=10000, entropy=None):
+    """
+    count adet şifreyi batch_size büyüklüğünde listeler halinde üretir.
+    Her pozisyonun karakter havuzu Fibonacci sayısıyla belirlenir; havuz içindeki
+    karakter entropy kaynağından (varsayılan: DEFAULT_ENTROPY) yansız seçilir.
+    Bir pozisyonun tüm toplu karakterleri tek bir translate çağrısıyla üretilir.
+    """
+    if length < 1:
+        raise ValueError("Şifre uzunluğu en az 1 olmalı")
+    method = resolve_method(method, length)
+    entropy = entropy or DEFAULT_ENTROPY
+    columns, needs_fixup = _password_columns(length, method)
+    stride = length + 1
+    remaining = count
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        with PROFILER.stage('transform', size * stride):
+            block = bytearray(b'\n') * (size * stride)
+            for i, (pool_size, table) in enumerate(columns):
+                block[i::stride] = entropy.randbelow_bytes(pool_size, size).translate(table)
+            batch = block.decode('ascii').split('\n')
+            batch.pop()
+            if needs_fixup:
+                for j, password in enumerate(batch):
+                    chars = list(password)
+                    _ensure_digit_and_special(chars, entropy)
+                    batch[j] = ''.join(chars)
+        yield batch
+        remaining -= size
 
 def generate_passwords(count=5, length=12, method='iterative'):
     """
     Birden fazla şifre oluşturur.
     """
     passwords = []
-    for _ in range(count):
-        password = generate_password_fibonacci(length, method)
-        passwords.append(password)
+    for batch in generate_password_batches(count, length, method):
+        passwords.extend(batch)
     return passwords
 
-def analyze_password_strength(password):
+def write_passwords(out, count, length=12, method='iterative', batch_size=10000):
     """
-    Analyzes the strength of a password.
-    Provides a more sophisticated and realistic evaluation.
+    Şifreleri toplu olarak üretip her satıra bir şifre olacak şekilde out akışına yazar.
+    Yazılan şifre sayısını döndürür.
     """
+    out, = _profiled_files(out)
+    written = 0
+    for batch in generate_password_batches(count, length, method, batch_size):
+        batch.append('')
+        out.write('\n'.join(batch))
+        written += len(batch) - 1
+    return written
+
+# Şifre gücü analizi için önceden hesaplanmış karakter sınıfları
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_DIGIT_CHARS = frozenset(string.digits)
+_SPECIAL_CHARS = frozenset(string.punctuation)
+
+# ASCII ardışık karakter kalıpları (abc, xyz, 123 ...), büyük/küçük harf duyarsız
+_SEQUENTIAL_PATTERN = re.compile(
+    '|'.join([string.ascii_lowercase[i:i + 3] for i in range(24)] +
+             [string.digits[i:i + 3] for i in range(8)]),
+    re.IGNORECASE | re.ASCII
+)
+
+# LANG yüklenmemişse kullanılan geri bildirim metinleri
+_DEFAULT_STRENGTH_TEXTS = {
+    'fb_too_short': "Password is too short, not secure!",
+    'fb_short': "Password is short, should be at least 8 characters.",
+    'fb_length_ok': "Password length is sufficient.",
+    'fb_no_lower': "Doesn't contain lowercase letters.",
+    'fb_no_upper': "Doesn't contain uppercase letters.",
+    'fb_no_digit': "Doesn't contain numbers.",
+    'fb_no_special': "Doesn't contain special characters.",
+    'fb_many_repeats': "Contains too many repeated characters.",
+    'fb_some_repeats': "Some characters are repeated.",
+    'fb_sequential': "Contains sequential characters (e.g.: abc, 123).",
+    'fb_low_entropy': "Character distribution is not diverse.",
+    'fb_increase_length': "Increase password length (at least 12 characters).",
+    'fb_use_all_classes': "Use lowercase, uppercase, numbers and special characters.",
+    'fb_avoid_repeats': "Use more diverse characters, avoid repetitions.",
+    'fb_avoid_sequential': "Use random characters instead of sequential ones.",
+    'weak': "Weak",
+    'medium': "Medium",
+    'strong': "Strong",
+    'very_strong': "Very Strong"
+}
+
+def _has_sequential(password):
+    """Ardışık üç karakter (abc, 123) olup olmadığını kontrol eder."""
+    if password.isascii():
+        return _SEQUENTIAL_PATTERN.search(password) is not None
+    for i in range(len(password) - 2):
+        # Alphabetic sequence (abc, xyz)
+        if (password[i].isalpha() and password[i+1].isalpha() and password[i+2].isalpha() and 
+            ord(password[i+1].lower()) == ord(password[i].lower()) + 1 and 
+            ord(password[i+2].lower()) == ord(password[i+1].lower()) + 1):
+            return True
+        # Numeric sequence (123, 789)
+        if (password[i].isdigit() and password[i+1].isdigit() and password[i+2].isdigit() and 
+            int(password[i+1]) == int(password[i]) + 1 and 
+            int(password[i+2]) == int(password[i+1]) + 1):
+            return True
+    return False
+
+@functools.lru_cache(maxsize=4096)
+def _shannon_entropy(length, counts):
+    """Karakter sıklıklarından (görünüş sırasıyla) Shannon entropisini hesaplar."""
+    entropy = 0
+    for freq in counts:
+        prob = freq / length
+        entropy -= prob * math.log2(prob)
+    return entropy
+
+def _strength_texts():
+    """Geçerli dile göre çözümlenmiş geri bildirim metinlerini döndürür."""
+    return LANG if 'fb_too_short' in LANG else _DEFAULT_STRENGTH_TEXTS
+
+def _score_password(password, texts):
+    """Tek bir şifreyi önceden çözümlenmiş metinlerle puanlar."""
     score = 0
     feedback = []
+    length = len(password)
     
     # Check length (0-4 points)
-    if len(password) < 6:
-        if 'benchmark_title' in LANG:  # Check if LANG is initialized
-            feedback.append("Password is too short, not secure!")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Şifre çok kısa, güvenli değil!"
-        else:
-            feedback.append("Password is too short, not secure!")
+    if length < 6:
+        feedback.append(texts['fb_too_short'])
         length_score = 0
-    elif len(password) < 8:
-        if 'benchmark_title' in LANG:
-            feedback.append("Password is short, should be at least 8 characters.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Şifre kısa, en az 8 karakter olmalı."
-        else:
-            feedback.append("Password is short, should be at least 8 characters.")
+    elif length < 8:
+        feedback.append(texts['fb_short'])
         length_score = 1
-    elif len(password) < 10:
-        if 'benchmark_title' in LANG:
-            feedback.append("Password length is sufficient.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Şifre uzunluğu yeterli."
-        else:
-            feedback.append("Password length is sufficient.")
+    elif length < 10:
+        feedback.append(texts['fb_length_ok'])
         length_score = 2
-    elif len(password) < 12:
+    elif length < 12:
         length_score = 3
     else:
         length_score = 4
         
     score += length_score
     
-    # Character diversity check (1 point each)
-    has_lower = any(c in string.ascii_lowercase for c in password)
-    has_upper = any(c in string.ascii_uppercase for c in password)
-    has_digit = any(c in string.digits for c in password)
-    has_special = any(c in string.punctuation for c in password)
-    
-    diversity_score = 0
-    
-    if has_lower:
-        diversity_score += 1
-    else:
-        if 'benchmark_title' in LANG:
-            feedback.append("Doesn't contain lowercase letters.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Küçük harf içermiyor."
-        else:
-            feedback.append("Doesn't contain lowercase letters.")
-    
-    if has_upper:
-        diversity_score += 1
-    else:
-        if 'benchmark_title' in LANG:
-            feedback.append("Doesn't contain uppercase letters.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Büyük harf içermiyor."
-        else:
-            feedback.append("Doesn't contain uppercase letters.")
-    
-    if has_digit:
-        diversity_score += 1
-    else:
-        if 'benchmark_title' in LANG:
-            feedback.append("Doesn't contain numbers.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Rakam içermiyor."
-        else:
-            feedback.append("Doesn't contain numbers.")
-    
-    if has_special:
-        diversity_score += 1
-    else:
-        if 'benchmark_title' in LANG:
-            feedback.append("Doesn't contain special characters.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Özel karakter içermiyor."
-        else:
-            feedback.append("Doesn't contain special characters.")
+    # Unique characters in order of appearance (used by all checks below)
+    unique_chars = dict.fromkeys(password)
     
+    # Character diversity check (1 point each)
+    has_lower = not _LOWERCASE.isdisjoint(unique_chars)
+    has_upper = not _UPPERCASE.isdisjoint(unique_chars)
+    has_digit = not _DIGIT_CHARS.isdisjoint(unique_chars)
+    has_special = not _SPECIAL_CHARS.isdisjoint(unique_chars)
+    
+    if not has_lower:
+        feedback.append(texts['fb_no_lower'])
+    if not has_upper:
+        feedback.append(texts['fb_no_upper'])
+    if not has_digit:
+        feedback.append(texts['fb_no_digit'])
+    if not has_special:
+        feedback.append(texts['fb_no_special'])
+    
+    diversity_score = has_lower + has_upper + has_digit + has_special
     score += diversity_score
     
-    # Complexity analysis
-    
     # Repeated character check
-    unique_ratio = len(set(password)) / len(password)
+    unique_ratio = len(unique_chars) / length
     if unique_ratio < 0.6:
-        if 'benchmark_title' in LANG:
-            feedback.append("Contains too many repeated characters.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Çok fazla tekrarlayan karakter içeriyor."
-        else:
-            feedback.append("Contains too many repeated characters.")
+        feedback.append(texts['fb_many_repeats'])
         score -= 2
     elif unique_ratio < 0.7:
-        if 'benchmark_title' in LANG:
-            feedback.append("Some characters are repeated.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Bazı karakterler tekrarlanıyor."
-        else:
-            feedback.append("Some characters are repeated.")
+        feedback.append(texts['fb_some_repeats'])
         score -= 1
     
     # Sequential character check
-    has_sequential = False
-    for i in range(len(password) - 2):
-        # Alphabetic sequence (abc, xyz)
-        if (password[i].isalpha() and password[i+1].isalpha() and password[i+2].isalpha() and 
-            ord(password[i+1].lower()) == ord(password[i].lower()) + 1 and 
-            ord(password[i+2].lower()) == ord(password[i+1].lower()) + 1):
-            has_sequential = True
-            break
-        # Numeric sequence (123, 789)
-        if (password[i].isdigit() and password[i+1].isdigit() and password[i+2].isdigit() and 
-            int(password[i+1]) == int(password[i]) + 1 and 
-            int(password[i+2]) == int(password[i+1]) + 1):
-            has_sequential = True
-            break
-            
+    has_sequential = _has_sequential(password)
     if has_sequential:
-        if 'benchmark_title' in LANG:
-            feedback.append("Contains sequential characters (e.g.: abc, 123).")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Ardışık karakterler içeriyor (örnek: abc, 123)."
-        else:
-            feedback.append("Contains sequential characters (e.g.: abc, 123).")
+        feedback.append(texts['fb_sequential'])
         score -= 1
     
-    # Common password pattern check (uppercase, lowercase, number, special character sequence)
-    typical_pattern = True
-    if len(password) >= 4:
-        # Typical pattern: Start with uppercase, continue with lowercase, end with number (e.g.: Pass123!)
-        if not (password[0].isupper() and password[1:3].islower() and password[-2].isdigit()):
-            typical_pattern = False
-    
-    if not typical_pattern:
+    # Common password pattern check: Start with uppercase, continue with lowercase, end with number (e.g.: Pass123!)
+    if length >= 4 and not (password[0].isupper() and password[1:3].islower() and password[-2].isdigit()):
         score += 1  # Bonus point for non-typical pattern
     
-    # Entropy (Shannon entropy calculation) - character distribution diversity
-    char_freq = {}
-    for char in password:
-        if char in char_freq:
-            char_freq[char] += 1
-        else:
-            char_freq[char] = 1
-    
-    entropy = 0
-    for char, freq in char_freq.items():
-        prob = freq / len(password)
-        entropy -= prob * math.log2(prob)
+    # Entropy (Shannon entropy calculation) - character distribution diversity
+    if len(unique_chars) == length:
+        entropy = _shannon_entropy(length, (1,) * length)
+    else:
+        entropy = _shannon_entropy(length, tuple(map(password.count, unique_chars)))
     
     # Entropy scoring (0-2 points)
     if entropy > 3.5:
@@ -450,12 +1784,7 @@ def analyze_password_strength(password):
     elif entropy > 2.5:
         score += 1
     elif entropy < 2.0:
-        if 'benchmark_title' in LANG:
-            feedback.append("Character distribution is not diverse.")
-            if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                feedback[-1] = "Karakter dağılımı çeşitli değil."
-        else:
-            feedback.append("Character distribution is not diverse.")
+        feedback.append(texts['fb_low_entropy'])
     
     # Total score evaluation (normalized)
     # Maximum score: 4 (length) + 4 (diversity) + 1 (atypical) + 2 (entropy) = 11
@@ -465,47 +1794,24 @@ def analyze_password_strength(password):
     
     # Strength evaluation
     if normalized_score <= 3:
-        strength = LANG.get('weak', "Weak") if 'weak' in LANG else "Weak"
+        strength = texts['weak']
     elif normalized_score <= 5:
-        strength = LANG.get('medium', "Medium") if 'medium' in LANG else "Medium"
+        strength = texts['medium']
     elif normalized_score <= 8:
-        strength = LANG.get('strong', "Strong") if 'strong' in LANG else "Strong"
+        strength = texts['strong']
     else:
-        strength = LANG.get('very_strong', "Very Strong") if 'very_strong' in LANG else "Very Strong"
+        strength = texts['very_strong']
     
     # Automatic suggestions
     if normalized_score < 7:
         if length_score < 3:
-            if 'benchmark_title' in LANG:
-                feedback.append("Increase password length (at least 12 characters).")
-                if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                    feedback[-1] = "Şifre uzunluğunu artırın (en az 12 karakter)."
-            else:
-                feedback.append("Increase password length (at least 12 characters).")
-        
+            feedback.append(texts['fb_increase_length'])
         if diversity_score < 4:
-            if 'benchmark_title' in LANG:
-                feedback.append("Use lowercase, uppercase, numbers and special characters.")
-                if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                    feedback[-1] = "Küçük harf, büyük harf, rakam ve özel karakter kullanın."
-            else:
-                feedback.append("Use lowercase, uppercase, numbers and special characters.")
-            
+            feedback.append(texts['fb_use_all_classes'])
         if unique_ratio < 0.7:
-            if 'benchmark_title' in LANG:
-                feedback.append("Use more diverse characters, avoid repetitions.")
-                if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                    feedback[-1] = "Daha çeşitli karakterler kullanın, tekrarlardan kaçının."
-            else:
-                feedback.append("Use more diverse characters, avoid repetitions.")
-            
+            feedback.append(texts['fb_avoid_repeats'])
         if has_sequential:
-            if 'benchmark_title' in LANG:
-                feedback.append("Use random characters instead of sequential ones.")
-                if LANG.get('benchmark_title') == "ALGORİTMA PERFORMANS KARŞILAŞTIRMASI":
-                    feedback[-1] = "Ardışık karakterler yerine rastgele karakterler kullanın."
-            else:
-                feedback.append("Use random characters instead of sequential ones.")
+            feedback.append(texts['fb_avoid_sequential'])
     
     return {
         "strength": strength,
@@ -513,6 +1819,24 @@ def analyze_password_strength(password):
         "feedback": feedback
     }
 
+@profiled('strength_analysis', lambda password: len(password))
+def analyze_password_strength(password):
+    """
+    Analyzes the strength of a password.
+    Provides a more sophisticated and realistic evaluation.
+    """
+    return _score_password(password, _strength_texts())
+
+def analyze_password_strengths(passwords):
+    """
+    Analyzes the strength of many passwords at once.
+    Language texts are resolved once for the whole batch.
+    """
+    texts = _strength_texts()
+    passwords = list(passwords)
+    with PROFILER.stage('strength_analysis', sum(map(len, passwords)) if PROFILER.enabled else 0):
+        return [_score_password(password, texts) for password in passwords]
+
 def performance_benchmark():
     """
     Compares the performance of different Fibonacci calculation algorithms.
@@ -534,11 +1858,12 @@ def performance_benchmark():
     
     # Limit n value for naive recursion to prevent stack overflow
     methods = [
-        ("Naive Recursion", lambda n: fib.naive_recursive(min(n, 25)), "naive"),
+        ("Naive Recursion", lambda n: fib.naive_recursive(min(n, NAIVE_CAP)), "naive"),
         ("Memoized Recursion", fib.memoized_recursive, "memoized"),
         ("Iterative", fib.iterative, "iterative"),
         ("Matrix Exponentiation", fib.matrix_exponentiation, "matrix"),
-        ("Binet's Formula", fib.binet_formula, "binet")
+        ("Binet's Formula", fib.binet_formula, "binet"),
+        ("Fast Doubling", fib.fast_doubling, "fast_doubling")
     ]
     
     # Progress bar
@@ -561,15 +1886,47 @@ def performance_benchmark():
     headers = [
         LANG['header_method'], 
         LANG['header_time'], 
+        LANG['header_p95'], 
+        LANG['header_stdev'], 
         LANG['header_memory_current'], 
         LANG['header_memory_peak'], 
+        LANG['header_rss_delta'], 
         LANG['header_accuracy']
     ]
-    table_data = [[r["method"], r["time"], r["memory_current"], r["memory_peak"], r["correct"]] for r in results]
+    table_data = [[r["method"], r["time"], r["p95"], r["stdev"], r["memory_current"], r["memory_peak"],
+                   "-" if r["rss_peak_delta"] is None else r["rss_peak_delta"], r["correct"]]
+                  for r in results]
     
     print_header(LANG['comparison_title'])
     print(tabulate(table_data, headers=headers, tablefmt="grid"))
     
+    # Size sweep: each engine computing F(n), then the full cipher round trip per format
+    print_info(LANG['sweep_running'])
+    engine_rows = benchmark_engines()
+    cipher_rows = benchmark_cipher()
+    sweep_headers = ["n", LANG['header_median_ms'], LANG['header_p95_ms'], LANG['header_stdev_ms'],
+                     LANG['header_memory_peak']]
+    
+    def sweep_table(rows, key):
+        return [[row[key], row["n"]] + ([LANG['skipped'], "-", "-", "-"] if row.get("skipped") else
+                [f"{row['median_ns'] / 1e6:.4f}", f"{row['p95_ns'] / 1e6:.4f}", f"{row['stdev_ns'] / 1e6:.4f}",
+                 f"{row['memory_peak'] / 1024:.1f}"])
+                for row in rows]
+    
+    engine_table = sweep_table(engine_rows, "engine")
+    cipher_table = sweep_table(cipher_rows, "path")
+    print_header(LANG['sweep_engines_title'])
+    print(tabulate(engine_table, headers=[LANG['header_method']] + sweep_headers, tablefmt="grid",
+                   colalign=("left", "right", "right", "right", "right", "right")))
+    print_header(LANG['sweep_cipher_title'])
+    print(tabulate(cipher_table, headers=[LANG['header_format']] + sweep_headers, tablefmt="grid",
+                   colalign=("left", "right", "right", "right", "right", "right")))
+    
+    # Memory breakdown per engine: what F(n) leaves behind (memo, result) and the process RSS growth
+    memory_headers, memory_table = _memory_table(benchmark_memory((10000,)))
+    print_header(LANG['memory_breakdown_title'])
+    print(tabulate(memory_table, headers=memory_headers, tablefmt="grid", disable_numparse=True))
+    
     # Find fastest and most memory-efficient methods
     fastest = min(results, key=lambda x: x["time"])
     most_memory_efficient = min(results, key=lambda x: x["memory_peak"])
@@ -581,17 +1938,26 @@ def performance_benchmark():
     # Show theoretical complexities
     print_section(LANG['theory_title'])
     
+    # Measured exponent k from a log-log fit of the engine sweep (time ≈ c·n^k)
+    measured = _scaling_series(engine_rows, "engine")
+    
+    def measured_exponent(key):
+        exponent = measured.get(key, {}).get("exponent")
+        return "-" if exponent is None else f"n^{exponent:.2f}"
+    
     complexity_data = [
-        ["Naive Recursion", "O(2^n)", LANG['expo_slowest']],
-        ["Memoized Recursion", "O(n)", LANG['linear_good']],
-        ["Iterative", "O(n)", LANG['linear_good_const']],
-        ["Matrix Exponentiation", "O(log n)", LANG['log_very_good']],
-        ["Binet's Formula", "O(1)", LANG['const_best']]
+        ["Naive Recursion", "O(2^n)", measured_exponent("naive"), LANG['expo_slowest']],
+        ["Memoized Recursion", "O(n)", measured_exponent("memoized"), LANG['linear_good']],
+        ["Iterative", "O(n)", measured_exponent("iterative"), LANG['linear_good_const']],
+        ["Matrix Exponentiation", "O(log n)", measured_exponent("matrix"), LANG['log_very_good']],
+        ["Binet's Formula", "O(1)", measured_exponent("binet"), LANG['const_best']],
+        ["Fast Doubling", "O(log n)", measured_exponent("fast_doubling"), LANG['log_very_good']]
     ]
     
     print(tabulate(complexity_data, headers=[
         LANG['header_algorithm'], 
         LANG['header_complexity'], 
+        LANG['header_exponent'], 
         LANG['header_description']
     ], tablefmt="grid"))
     
@@ -600,47 +1966,299 @@ def performance_benchmark():
     with open("fibonacci_performance.md", "w", encoding="utf-8") as f:
         f.write("# Fibonacci Algorithm Performance Results\n\n")
         f.write(tabulate(table_data, headers=headers, tablefmt="pipe"))
+        f.write(f"\n\n## {LANG['sweep_engines_title']}\n\n")
+        f.write(tabulate(engine_table, headers=[LANG['header_method']] + sweep_headers, tablefmt="pipe"))
+        f.write(f"\n\n## {LANG['sweep_cipher_title']}\n\n")
+        f.write(tabulate(cipher_table, headers=[LANG['header_format']] + sweep_headers, tablefmt="pipe"))
+        f.write(f"\n\n## {LANG['memory_breakdown_title']}\n\n")
+        f.write(tabulate(memory_table, headers=memory_headers, tablefmt="pipe", disable_numparse=True))
         f.write("\n\n## Summary\n\n")
         f.write(f"* {LANG['fastest_method'].format(fastest['method'], fastest['time'])}\n")
         f.write(f"* {LANG['memory_efficient'].format(most_memory_efficient['method'], most_memory_efficient['memory_peak'])}\n\n")
         
         f.write("## About the Methods\n\n")
         f.write("* **Naive Recursion**: Slowest method as it recalculates the same values repeatedly. Has O(2^n) time complexity.\n")
-        f.write("* **Memoized Recursion**: Top-down dynamic programming approach. Values are stored and reused. Has O(n) time and O(n) space complexity.\n")
+        f.write("* **Memoized Recursion**: Dynamic programming with a cache. Values are filled bottom-up (no recursion depth limit), stored and reused; the cache can be bounded by entry count or bytes. Has O(n) time and O(n) space complexity.\n")
         f.write("* **Iterative**: Bottom-up dynamic programming approach. Uses less memory. Has O(n) time and O(1) space complexity.\n")
         f.write("* **Matrix Exponentiation**: Calculates in logarithmic time using matrix exponentiation. Has O(log n) time complexity.\n")
-        f.write("* **Binet's Formula**: Closed-form solution. Theoretically has O(1) time complexity, but may have precision issues for large numbers in practice.\n")
+        f.write("* **Binet's Formula**: Closed-form solution. Theoretically has O(1) time complexity; floating point is only exact up to n=70, so larger n switch to exact integer arithmetic in Z[√5].\n")
+        f.write("* **Fast Doubling**: Uses the F(2k) and F(2k+1) identities iteratively without intermediate matrices. Has O(log n) time complexity with fewer multiplications than matrix exponentiation.\n")
     
     print_success(LANG['results_saved'].format('fibonacci_performance.md'))
     
     input(f"\n{LANG['continue']}")
 
-def encrypt_file(input_file, output_file, fib_method_name='iterative'):
+# Akış (chunk) tabanlı dosya şifreleme
+DEFAULT_CHUNK_SIZE = 64 * 1024  # bayt
+
+def _read_chunks(src, chunk_size):
+    """Kaynak akıştan sabit boyutlu parçalar okur."""
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def _read_text_chunks(src, chunk_size):
+    """İkili akıştan UTF-8 metin parçaları okur (çok baytlı karakterler bölünmez)."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in _read_chunks(src, chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+def _remaining_length(src):
+    """Dosya akışında kalan bayt sayısını döndürür; bilinmiyorsa None."""
+    try:
+        return os.fstat(src.fileno()).st_size - src.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+@profiled('serialization')
+def _binary_header(method_name, length=None, bits=8):
+    """İkili biçim (sürüm 2) başlığını oluşturur."""
+    return _BINARY_HEADER.pack(CIPHER_MAGIC, BINARY_VERSION, bits, FIB_METHOD_IDS.get(method_name, 0),
+                               UNKNOWN_LENGTH if length is None else length)
+
+def _decimal_char_limit():
+    """
+    Ondalık biçimde şifrelenebilecek en fazla karakter sayısı. F(n) yaklaşık
+    n * log10(φ) basamaklıdır; yorumlayıcının tamsayı-metin basamak sınırı
+    aşılırsa str() hata verir. Sınır yoksa None döner.
+    """
+    max_digits = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    if not max_digits:
+        return None
+    return int((max_digits - 1) / math.log10((1 + 5 ** 0.5) / 2))
+
+def encrypt_fileobj(src, dst, fib_method, mode='decimal', bits=8, chunk_size=DEFAULT_CHUNK_SIZE,
+                    method_name='iterative'):
+    """
+    İkili src akışını parça parça şifreleyip dst akışına yazar.
+    Anahtar akışının pozisyonu parçalar arasında korunur; bellek kullanımı
+    dosya boyutundan bağımsız olarak chunk_size ile sınırlı kalır.
+    mode='binary' herhangi bir bayt dizisini (metin olması gerekmez) şifreler;
+    başlığa method_name ve orijinal uzunluk yazılır.
+    """
+    src, dst = _profiled_files(src, dst)
+    if mode == 'binary':
+        keystream = FibonacciKeystream(fib_method, modulus=256)
+        dst.write(_binary_header(method_name, _remaining_length(src)))
+        for chunk in _read_chunks(src, chunk_size):
+            dst.write(_crypt_bytes(chunk, keystream))
+        return
+
+    if mode == 'modular':
+        if bits not in MODULAR_WIDTHS:
+            raise ValueError(f"Desteklenmeyen genişlik: {bits} (desteklenen: {MODULAR_WIDTHS})")
+        mask = (1 << bits) - 1
+        keystream = FibonacciKeystream(fib_method, modulus=mask + 1)
+        dst.write(_MODULAR_HEADER.pack(CIPHER_MAGIC, MODULAR_VERSION, bits))
+        # 8 bit: UTF-8 baytları doğrudan, 32 bit: kod noktaları
+        chunks = _read_chunks(src, chunk_size) if bits == 8 else _read_text_chunks(src, chunk_size)
+        for chunk in chunks:
+            if keystream.vectorizable(len(chunk)):
+                with PROFILER.stage('transform', len(chunk)):
+                    symbols = np.frombuffer(chunk, np.uint8) if bits == 8 else _vector_symbols(chunk, bits)
+                    encrypted = _vector_crypt(symbols, keystream).astype(_vector_dtype(bits), copy=False).tobytes()
+                dst.write(encrypted)
+                continue
+            with PROFILER.stage('transform', len(chunk)):
+                symbols = chunk if bits == 8 else map(ord, chunk)
+                encrypted = [(symbol + fib_val) & mask for symbol, fib_val in zip(symbols, keystream)]
+            dst.write(_words_to_bytes(encrypted, bits))
+        return
+
+    keystream = FibonacciKeystream(fib_method)
+    limit = _decimal_char_limit()
+    separator = b''
+    for text in _read_text_chunks(src, chunk_size):
+        if limit is not None and keystream.position + len(text) > limit:
+            raise ValueError(f"Ondalık biçim en fazla {limit} karakter destekler; --format binary kullanın")
+        with PROFILER.stage('transform', len(text)):
+            encrypted = ' '.join(str(ord(char) + fib_val) for char, fib_val in zip(text, keystream))
+        dst.write(separator + encrypted.encode('ascii'))
+        separator = b' '
+
+def _decrypt_fixed_width(src, dst, keystream, bits, chunk_size, length=None):
+    """
+    Sabit genişlikli gövdeyi önceden ayrılmış bir tampona readinto ile okuyarak çözer.
+    Parça sınırında bölünen sembolün baytları tamponun başına taşınır.
+    """
+    mask = (1 << bits) - 1
+    width = bits // 8
+    buffer = bytearray(max(width, chunk_size - chunk_size % width))
+    view = memoryview(buffer)
+    filled = 0
+    symbols = 0
+    while True:
+        count = src.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+        usable = filled - filled % width
+        if not usable:
+            continue
+        if bits == 8:
+            dst.write(_crypt_bytes(view[:usable], keystream, decrypt=True))
+        elif keystream.vectorizable(usable // width):
+            with PROFILER.stage('transform', usable):
+                words = np.frombuffer(view[:usable], _vector_dtype(bits))
+                decrypted = _vector_text(_vector_crypt(words, keystream, decrypt=True), bits).encode('utf-8')
+            dst.write(decrypted)
+        else:
+            words = _bytes_to_words(view[:usable], bits)
+            with PROFILER.stage('transform', usable):
+                decrypted = ''.join(chr((val - fib_val) & mask) for val, fib_val in zip(words, keystream))
+            dst.write(decrypted.encode('utf-8'))
+        symbols += usable // width
+        view[:filled - usable] = view[usable:filled]
+        filled -= usable
+    if filled:
+        raise ValueError("Şifreli dosya eksik: son sembol tamamlanmamış")
+    if length is not None and symbols != length:
+        raise ValueError(f"Şifreli dosya uzunluğu uyuşmuyor: {symbols} / {length}")
+
+def decrypt_fileobj(src, dst, fib_method=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    encrypt_fileobj çıktısını parça parça çözer; biçim başlıktan algılanır.
+    fib_method verilmezse başlıktaki yöntem (yoksa iterative) kullanılır.
+    """
+    src, dst = _profiled_files(src, dst)
+    header, head = read_cipher_header(src)
+    if header is not None:
+        if fib_method is None and header["method"]:
+            fib_method = get_fib_method(FibonacciMethods(), header["method"])
+        keystream = FibonacciKeystream(fib_method, modulus=1 << header["bits"])
+        _decrypt_fixed_width(src, dst, keystream, header["bits"], chunk_size, header["length"])
+        return
+
+    keystream = FibonacciKeystream(fib_method)
+    pending = head
+    for chunk in _read_chunks(src, chunk_size):
+        data = pending + chunk
+        tokens = data.split()
+        # Parça sınırında bölünmüş son sayı bir sonraki parçaya taşınır
+        pending = tokens.pop() if tokens and not data[-1:].isspace() else b''
+        with PROFILER.stage('transform', len(data) - len(pending)):
+            decrypted = ''.join(chr(int(token) - fib_val) for token, fib_val in zip(tokens, keystream))
+        dst.write(decrypted.encode('utf-8'))
+    tokens = pending.split()
+    with PROFILER.stage('transform', len(pending)):
+        decrypted = ''.join(chr(int(token) - fib_val) for token, fib_val in zip(tokens, keystream))
+    dst.write(decrypted.encode('utf-8'))
+
+# Çok çekirdekli şifreleme: her işçi anahtar akışını kendi aralığının başına konumlar
+PARALLEL_RANGE_SIZE = 4 * 1024 * 1024  # işçi başına bayt
+
+def _crypt_file_range(path, offset, size, start, bits, method_name, decrypt):
+    """
+    Dosyanın [offset, offset + size) aralığını okuyup şifreler veya çözer.
+    start, aralığın ilk sembolünün anahtar akışındaki pozisyonudur.
+    ProcessPoolExecutor işçilerinde çalışır.
+    """
+    with open(path, 'rb') as f, PROFILER.stage('file_io', size):
+        f.seek(offset)
+        data = f.read(size)
+    fib_method = get_fib_method(FibonacciMethods(), method_name)
+    keystream = FibonacciKeystream(fib_method, start, modulus=1 << bits)
+    if bits == 8:
+        return _crypt_bytes(data, keystream, decrypt)
+    return _crypt_words(data if decrypt else data.decode('utf-8'), keystream, bits, decrypt)
+
+@profiled('transform', lambda data, *args, **kwargs: len(data))
+def _crypt_words(data, keystream, bits, decrypt=False):
+    """
+    Geniş (32 bit) sembollere anahtar akışını uygular.
+    Şifrelerken data metindir ve sabit genişlikli baytlar döner; çözerken data
+    sabit genişlikli baytlardır ve UTF-8 metin baytları döner.
+    """
+    if keystream.vectorizable(len(data) // (bits // 8) if decrypt else len(data)):
+        if decrypt:
+            words = np.frombuffer(data, _vector_dtype(bits))
+            return _vector_text(_vector_crypt(words, keystream, decrypt=True), bits).encode('utf-8')
+        encrypted = _vector_crypt(_vector_symbols(data, bits), keystream)
+        return encrypted.astype(_vector_dtype(bits), copy=False).tobytes()
+    mask = (1 << bits) - 1
+    if decrypt:
+        words = _bytes_to_words(data, bits)
+        return ''.join(chr((val - fib_val) & mask) for val, fib_val in zip(words, keystream)).encode('utf-8')
+    return _words_to_bytes([(ord(char) + fib_val) & mask for char, fib_val in zip(data, keystream)], bits)
+
+def _parallel_crypt(path, dst, body_offset, body_size, bits, method_name, decrypt, workers,
+                    range_size=PARALLEL_RANGE_SIZE):
+    """
+    Gövdeyi sabit boyutlu aralıklara bölüp işçilere dağıtır ve sonuçları sırayla yazar.
+    Bellekte aynı anda en fazla workers * 2 aralık tutulur.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    width = bits // 8
+    range_size = max(width, range_size - range_size % width)
+    dst, = _profiled_files(dst)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for offset in range(0, body_size, range_size):
+            if len(pending) >= workers * 2:
+                dst.write(pending.popleft().result())
+            pending.append(executor.submit(_crypt_file_range, path, body_offset + offset,
+                                           min(range_size, body_size - offset), offset // width,
+                                           bits, method_name, decrypt))
+        while pending:
+            dst.write(pending.popleft().result())
+
+def decrypt_range(input_file, start, end=None, fib_method_name=None):
+    """
+    Sabit genişlikli şifreli dosyanın (modular, binary) yalnızca [start, end) aralığını çözer.
+    Aralık binary ve 8 bit modular dosyalarda açık metin baytı, 32 bit modular
+    dosyalarda karakter (kod noktası) cinsindendir. Anahtar akışı doğrudan start
+    pozisyonuna konumlandırılır; dosyanın yalnızca istenen kısmı okunur.
+    Ondalık biçimdeki sayılar değişken genişlikli olduğundan ValueError yükseltilir.
+    """
+    with open(input_file, 'rb') as src:
+        header, head = read_cipher_header(src)
+        if header is None:
+            raise ValueError("Aralık çözme yalnızca sabit genişlikli (modular, binary) dosyalarda desteklenir")
+        width = header["bits"] // 8
+        total = (os.fstat(src.fileno()).st_size - len(head)) // width
+    end = total if end is None else min(end, total)
+    start = min(max(0, start), end)
+    method_name = resolve_method(fib_method_name or header["method"] or 'iterative', end)
+    return _crypt_file_range(input_file, len(head) + start * width, (end - start) * width, start,
+                             header["bits"], method_name, True)
+
+def encrypt_file(input_file, output_file, fib_method_name='iterative', mode='decimal', bits=8,
+                 chunk_size=DEFAULT_CHUNK_SIZE, workers=1, use_mmap=False):
     """
     Dosyayı şifreler.
+    mode='decimal' eski ondalık metin biçimini, mode='modular' ise sabit
+    genişlikli (F(i) mod 2^bits) ikili biçimi, mode='binary' ise herhangi bir
+    dosya için bayt tabanlı biçimi üretir. Dosya parça parça işlenir.
+    workers > 1 ise bayt tabanlı biçimler (binary, 8 bit modular) aralıklara
+    bölünüp paralel işlenir; use_mmap=True ise aynı biçimler mmap ile işlenir.
     """
-    fib = FibonacciMethods()
-    
-    # Kullanılacak Fibonacci metodu
-    method_func = {
-        'naive': lambda n: fib.naive_recursive(min(n, 25)),
-        'memoized': fib.memoized_recursive,
-        'iterative': fib.iterative,
-        'matrix': fib.matrix_exponentiation,
-        'binet': fib.binet_formula
-    }.get(fib_method_name, fib.iterative)
-    
     try:
-        # Dosyayı oku
-        with open(input_file, 'r', encoding='utf-8') as f:
-            text = f.read()
+        # Kullanılacak Fibonacci metodu ('auto': AUTO_METHOD)
+        fib_method_name = resolve_method(fib_method_name, os.path.getsize(input_file))
+        method_func = get_fib_method(FibonacciMethods(), fib_method_name)
         
-        # Şifrele
-        encrypted = encrypt(text, method_func)
-        
-        # Şifrelenmiş veriyi kaydet
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(' '.join(map(str, encrypted)))
+        if workers > 1 and (mode == 'binary' or (mode == 'modular' and bits == 8)):
+            # Bayt pozisyonu = anahtar akışı pozisyonu; aralıklar bağımsız şifrelenir
+            size = os.path.getsize(input_file)
+            with open(output_file, 'wb') as dst:
+                if mode == 'binary':
+                    dst.write(_binary_header(fib_method_name, size))
+                else:
+                    dst.write(_MODULAR_HEADER.pack(CIPHER_MAGIC, MODULAR_VERSION, 8))
+                _parallel_crypt(input_file, dst, 0, size, 8, fib_method_name, False, workers)
+        elif use_mmap and (mode == 'binary' or (mode == 'modular' and bits == 8)):
+            encrypt_file_mmap(input_file, output_file, fib_method_name, mode)
+        else:
+            # Dosyayı parça parça oku, şifrele ve kaydet
+            with open(input_file, 'rb') as src, open(output_file, 'wb') as dst:
+                encrypt_fileobj(src, dst, method_func, mode, bits, chunk_size, fib_method_name)
         
         print(f"Dosya başarıyla şifrelendi: {output_file}")
         return True
@@ -648,35 +2266,43 @@ def encrypt_file(input_file, output_file, fib_method_name='iterative'):
         print(f"Dosya şifreleme hatası: {e}")
         return False
 
-def decrypt_file(input_file, output_file, fib_method_name='iterative'):
+def decrypt_file(input_file, output_file, fib_method_name=None, chunk_size=DEFAULT_CHUNK_SIZE, workers=1,
+                 use_mmap=False):
     """
     Şifrelenmiş dosyayı çözer.
+    Dosya biçimi (ondalık, modüler veya ikili) başlıktan otomatik olarak algılanır.
+    fib_method_name verilmezse ikili dosyalarda başlıktaki yöntem kullanılır.
+    workers > 1 ise sabit genişlikli biçimler aralıklara bölünüp paralel çözülür;
+    use_mmap=True ise 8 bit biçimler mmap ile çözülür.
     """
-    fib = FibonacciMethods()
-    
-    # Kullanılacak Fibonacci metodu
-    method_func = {
-        'naive': lambda n: fib.naive_recursive(min(n, 25)),
-        'memoized': fib.memoized_recursive,
-        'iterative': fib.iterative,
-        'matrix': fib.matrix_exponentiation,
-        'binet': fib.binet_formula
-    }.get(fib_method_name, fib.iterative)
-    
     try:
-        # Şifrelenmiş veriyi oku
-        with open(input_file, 'r', encoding='utf-8') as f:
-            encrypted_text = f.read()
+        # Kullanılacak Fibonacci metodu
+        if fib_method_name:
+            fib_method_name = resolve_method(fib_method_name, os.path.getsize(input_file))
+        method_func = get_fib_method(FibonacciMethods(), fib_method_name) if fib_method_name else None
         
-        # Sayılara dönüştür
-        encrypted_values = list(map(int, encrypted_text.split()))
+        header = None
+        if workers > 1 or use_mmap:
+            with open(input_file, 'rb') as src:
+                header, head = read_cipher_header(src)
         
-        # Şifreyi çöz
-        decrypted = decrypt(encrypted_values, method_func)
-        
-        # Çözülmüş veriyi kaydet
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(decrypted)
+        if use_mmap and workers <= 1 and header is not None and header["bits"] == 8:
+            decrypt_file_mmap(input_file, output_file, fib_method_name)
+        elif workers > 1 and header is not None:
+            body_size = os.path.getsize(input_file) - len(head)
+            width = header["bits"] // 8
+            if body_size % width:
+                raise ValueError("Şifreli dosya eksik: son sembol tamamlanmamış")
+            if header["length"] is not None and body_size // width != header["length"]:
+                raise ValueError(f"Şifreli dosya uzunluğu uyuşmuyor: {body_size // width} / {header['length']}")
+            method_name = fib_method_name or header["method"] or 'iterative'
+            with open(output_file, 'wb') as dst:
+                _parallel_crypt(input_file, dst, len(head), body_size, header["bits"], method_name, True, workers)
+        else:
+            # Şifrelenmiş veriyi parça parça oku, çöz ve kaydet
+            # (mmap ile çözülemeyen biçimler, ör. 32 bit modular, de buraya düşer)
+            with open(input_file, 'rb') as src, open(output_file, 'wb') as dst:
+                decrypt_fileobj(src, dst, method_func, chunk_size)
         
         print(f"Dosya başarıyla çözüldü: {output_file}")
         return True
@@ -684,6 +2310,587 @@ def decrypt_file(input_file, output_file, fib_method_name='iterative'):
         print(f"Dosya şifre çözme hatası: {e}")
         return False
 
+# Bellek eşlemeli (mmap) dosya şifreleme: veri sayfa önbelleği üzerinden dönüştürülür
+MMAP_WINDOW = 16 * 1024 * 1024  # bayt
+
+def _mmap_crypt(src_map, dst_map, src_offset, dst_offset, size, keystream, decrypt=False,
+                window=MMAP_WINDOW):
+    """
+    src_map[src_offset:] aralığındaki size baytı memoryview pencereleriyle
+    dönüştürüp dst_map[dst_offset:] aralığına yazar. src_map ve dst_map
+    aynı eşleme olabilir (yerinde dönüşüm).
+    """
+    src_view = memoryview(src_map)[src_offset:src_offset + size]
+    dst_view = memoryview(dst_map)[dst_offset:dst_offset + size]
+    try:
+        for offset in range(0, size, window):
+            end = min(offset + window, size)
+            _crypt_bytes_into(src_view[offset:end], dst_view[offset:end], keystream, decrypt)
+    finally:
+        src_view.release()
+        dst_view.release()
+
+def _mmap_crypt_files(input_file, output_file, header, body_offset, size, keystream, decrypt):
+    """
+    Çıktı dosyasını len(header) + size bayt olarak önceden ayırır, başlığı yazar
+    ve girdinin body_offset sonrasındaki gövdesini eşlemeler üzerinden dönüştürür.
+    """
+    with open(output_file, 'w+b') as dst:
+        dst.write(header)
+        dst.truncate(len(header) + size)
+        if not size:
+            return
+        with open(input_file, 'rb') as src, \
+                mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                mmap.mmap(dst.fileno(), 0) as dst_map:
+            _mmap_crypt(src_map, dst_map, body_offset, len(header), size, keystream, decrypt)
+            with PROFILER.stage('file_io', size):
+                dst_map.flush()
+
+def encrypt_file_mmap(input_file, output_file, fib_method_name='iterative', mode='binary'):
+    """
+    Bayt tabanlı biçimlerde (binary, 8 bit modular) dosyayı mmap ile şifreler.
+    Çıktı aynı boyutta önceden ayrılır; veri Python tarafında read/write
+    tamponlarına kopyalanmadan pencere pencere dönüştürülür.
+    """
+    size = os.path.getsize(input_file)
+    fib_method_name = resolve_method(fib_method_name, size)
+    if mode == 'binary':
+        header = _binary_header(fib_method_name, size)
+    else:
+        header = _MODULAR_HEADER.pack(CIPHER_MAGIC, MODULAR_VERSION, 8)
+    fib_method = get_fib_method(FibonacciMethods(), fib_method_name)
+    keystream = FibonacciKeystream(fib_method, modulus=256)
+    _mmap_crypt_files(input_file, output_file, header, 0, size, keystream, False)
+
+def decrypt_file_mmap(input_file, output_file, fib_method_name=None):
+    """
+    8 bit sabit genişlikli şifreli dosyayı (binary veya modular) mmap ile çözer.
+    Diğer biçimlerde ValueError yükseltir.
+    """
+    with open(input_file, 'rb') as src:
+        header, head = read_cipher_header(src)
+    if header is None or header["bits"] != 8:
+        raise ValueError("mmap yalnızca 8 bit sabit genişlikli şifreli dosyaları destekler")
+    size = os.path.getsize(input_file) - len(head)
+    if header["length"] is not None and size != header["length"]:
+        raise ValueError(f"Şifreli dosya uzunluğu uyuşmuyor: {size} / {header['length']}")
+    method_name = fib_method_name or header["method"] or 'iterative'
+    fib_method = get_fib_method(FibonacciMethods(), method_name, n=size)
+    keystream = FibonacciKeystream(fib_method, modulus=256)
+    _mmap_crypt_files(input_file, output_file, b'', len(head), size, keystream, True)
+
+def crypt_file_inplace(path, fib_method_name='iterative', decrypt=False, start=0):
+    """
+    Dosyayı başlıksız olarak, F(i) mod 256 anahtar akışıyla yerinde şifreler veya çözer.
+    Dosya boyutu değişmez; ek disk alanı gerekmez. Yöntem başlığa yazılmadığından
+    çözerken aynı yöntem verilmelidir.
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return
+    fib_method = get_fib_method(FibonacciMethods(), fib_method_name, n=start + size)
+    keystream = FibonacciKeystream(fib_method, start, modulus=256)
+    with open(path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as file_map:
+        _mmap_crypt(file_map, file_map, 0, 0, size, keystream, decrypt)
+        file_map.flush()
+
+# Toplu (dizin / glob) şifreleme ve manifest
+BATCH_SUFFIXES = {'encrypt': '.enc', 'decrypt': '.dec'}
+
+def expand_batch_paths(patterns, skip_suffix=None):
+    """
+    Dizinleri (özyinelemeli) ve glob desenlerini dosya listesine açar.
+    (yol, göreli_yol) çiftlerini sıralı ve tekrarsız döndürür; göreli yol
+    çıktı dizinindeki yerleşim için kullanılır. skip_suffix ile biten
+    dosyalar (önceki çalıştırmaların çıktıları) atlanır.
+    """
+    seen = set()
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = ((os.path.join(root, name), pattern)
+                          for root, _, names in os.walk(pattern) for name in names)
+        else:
+            # Göreli yol, desenin joker içermeyen baş kısmına göre hesaplanır
+            base = os.path.dirname(pattern)
+            while glob.has_magic(base):
+                base = os.path.dirname(base)
+            candidates = ((path, base) for path in glob.glob(pattern, recursive=True))
+        for path, base in candidates:
+            if not os.path.isfile(path) or (skip_suffix and path.endswith(skip_suffix)):
+                continue
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                files.append((path, os.path.relpath(path, base or os.curdir)))
+    files.sort()
+    return files
+
+def _file_checksum(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Dosyanın SHA-256 özetini döndürür."""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in _read_chunks(*_profiled_files(f), chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _batch_crypt_file(task):
+    """
+    Toplu işin tek bir dosyasını şifreler veya çözer ve manifest kaydını döndürür.
+    Hatalar yükseltilmez, kayda yazılır; böylece bir dosya tüm işi durdurmaz.
+    """
+    path, output, operation, method_name, mode, bits, chunk_size = task
+    stat = os.stat(path)
+    if method_name:
+        method_name = resolve_method(method_name, stat.st_size)
+    record = {"path": path, "output": output, "size": stat.st_size, "mtime": stat.st_mtime,
+              "operation": operation, "method": method_name, "mode": mode}
+    started = time.perf_counter()
+    try:
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'rb') as src, open(output, 'wb') as dst:
+            if operation == 'encrypt':
+                fib_method = get_fib_method(FibonacciMethods(), method_name)
+                encrypt_fileobj(src, dst, fib_method, mode, bits, chunk_size, method_name)
+            else:
+                fib_method = get_fib_method(FibonacciMethods(), method_name) if method_name else None
+                decrypt_fileobj(src, dst, fib_method, chunk_size)
+        record["checksum"] = _file_checksum(output, chunk_size)
+        record["status"] = "ok"
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+    record["duration"] = round(time.perf_counter() - started, 6)
+    return record
+
+def load_manifest(manifest_path):
+    """
+    Manifest dosyasındaki (JSON satırları) kayıtları yol -> kayıt sözlüğü olarak okur.
+    Aynı yol birden çok kez yazıldıysa son kayıt geçerlidir; yarım kalmış son satır yok sayılır.
+    """
+    records = {}
+    if not os.path.exists(manifest_path):
+        return records
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record["path"]] = record
+    return records
+
+def _is_done(record, path):
+    """Manifest kaydı dosyanın değişmeden başarıyla işlendiğini gösteriyorsa True döndürür."""
+    if not record or record.get("status") != "ok" or not os.path.exists(record["output"]):
+        return False
+    stat = os.stat(path)
+    return record["size"] == stat.st_size and record["mtime"] == stat.st_mtime
+
+def batch_crypt(patterns, operation='encrypt', method_name=None, mode='decimal', bits=8,
+                output_dir=None, manifest_path=None, resume=False, workers=1,
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Dizin ve glob desenleriyle eşleşen tüm dosyaları şifreler veya çözer.
+    workers > 1 ise dosyalar süreç havuzunda eşzamanlı işlenir. Her dosya
+    bittiğinde manifest dosyasına (path, size, method, duration, checksum)
+    bir JSON satırı eklenir; resume=True ise manifestte başarılı görünen ve
+    o zamandan beri değişmemiş dosyalar atlanır.
+    Sonuç sözlüğü: processed, skipped, failed (kayıt listesi).
+    """
+    suffix = BATCH_SUFFIXES[operation]
+    if operation == 'encrypt':
+        method_name = method_name or 'iterative'
+    done = load_manifest(manifest_path) if manifest_path and resume else {}
+    
+    tasks = []
+    skipped = 0
+    for path, relative in expand_batch_paths(patterns, suffix):
+        if _is_done(done.get(path), path):
+            skipped += 1
+            continue
+        output = os.path.join(output_dir, relative) + suffix if output_dir else path + suffix
+        tasks.append((path, output, operation, method_name, mode, bits, chunk_size))
+    
+    processed = 0
+    failed = []
+    manifest = open(manifest_path, 'a', encoding='utf-8') if manifest_path else None
+    try:
+        if workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=workers)
+            # Küçük dosyalarda süreçler arası iletişim maliyetini paylaştırmak için gruplanır
+            records = executor.map(_batch_crypt_file, tasks,
+                                   chunksize=max(1, min(64, len(tasks) // (workers * 4))))
+        else:
+            executor = None
+            records = map(_batch_crypt_file, tasks)
+        try:
+            for record in records:
+                if manifest:
+                    manifest.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    manifest.flush()
+                if record["status"] == "ok":
+                    processed += 1
+                else:
+                    failed.append(record)
+        finally:
+            if executor:
+                # Kesintide kuyruktaki dosyalar beklenmez (cancel_futures: Python 3.9+)
+                if sys.version_info >= (3, 9):
+                    executor.shutdown(cancel_futures=True)
+                else:
+                    executor.shutdown()
+    finally:
+        if manifest:
+            manifest.close()
+    
+    return {"processed": processed, "skipped": skipped, "failed": failed}
+
+# asyncio akış API'si: CPU işi yürütücüye aktarılır, yazma tarafında drain ile geri basınç uygulanır
+class FixedWidthTransform:
+    """
+    Parça parça gelen veriye sabit genişlikli (8/32 bit) anahtar akışını uygulayan durum nesnesi.
+    update() her parça için çıktı baytlarını döndürür; parça sınırında bölünen
+    UTF-8 karakterleri veya 32 bit semboller bir sonraki parçaya taşınır.
+    """
+
+    def __init__(self, keystream, bits=8, decrypt=False, length=None):
+        self.keystream = keystream
+        self.bits = bits
+        self.decrypt = decrypt
+        self.length = length
+        self.symbols = 0
+        self.pending = b''
+        self.decoder = codecs.getincrementaldecoder('utf-8')() if bits == 32 and not decrypt else None
+
+    def update(self, chunk):
+        if self.bits == 8:
+            self.symbols += len(chunk)
+            return _crypt_bytes(chunk, self.keystream, self.decrypt)
+        if self.decoder is not None:
+            text = self.decoder.decode(chunk)
+            self.symbols += len(text)
+            return _crypt_words(text, self.keystream, self.bits)
+        data = self.pending + chunk
+        usable = len(data) - len(data) % 4
+        self.pending = data[usable:]
+        self.symbols += usable // 4
+        return _crypt_words(data[:usable], self.keystream, self.bits, decrypt=True)
+
+    def final(self):
+        """Kalan veriyi işler ve uzunluğu doğrular."""
+        data = b''
+        if self.decoder is not None:
+            text = self.decoder.decode(b'', final=True)
+            self.symbols += len(text)
+            data = _crypt_words(text, self.keystream, self.bits)
+        if self.pending:
+            raise ValueError("Şifreli dosya eksik: son sembol tamamlanmamış")
+        if self.decrypt and self.length is not None and self.symbols != self.length:
+            raise ValueError(f"Şifreli dosya uzunluğu uyuşmuyor: {self.symbols} / {self.length}")
+        return data
+
+def _fixed_width_header(mode, bits, method_name, length=None):
+    """binary / modular kapsayıcı başlığını ve sembol genişliğini döndürür."""
+    if mode == 'binary':
+        return _binary_header(method_name, length), 8
+    if mode == 'modular' and bits in MODULAR_WIDTHS:
+        return _MODULAR_HEADER.pack(CIPHER_MAGIC, MODULAR_VERSION, bits), bits
+    raise ValueError(f"Desteklenmeyen akış biçimi: {mode} / {bits} bit")
+
+async def _aread_chunks(reader, chunk_size):
+    """asyncio StreamReader'dan (read metodu) veya herhangi bir asenkron bayt yineleyicisinden okur."""
+    if hasattr(reader, 'read'):
+        while True:
+            chunk = await reader.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in reader:
+            if chunk:
+                yield bytes(chunk)
+
+async def _awrite(writer, data):
+    """Veriyi yazar ve yazıcı destekliyorsa (StreamWriter.drain) tampon boşalana kadar bekler."""
+    if not data:
+        return
+    writer.write(data)
+    drain = getattr(writer, 'drain', None)
+    if drain is not None:
+        await drain()
+
+async def _apump(chunks, writer, transform, executor=None):
+    """
+    Parçaları sırayla yürütücüde dönüştürüp yazar. Bir parça dönüştürülürken
+    bir önceki yazılır ve bir sonraki okunur; bellekte en fazla üç parça bulunur.
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    pending = None
+    async for chunk in chunks:
+        data = await pending if pending is not None else b''
+        pending = loop.run_in_executor(executor, transform.update, chunk)
+        await _awrite(writer, data)
+    if pending is not None:
+        await _awrite(writer, await pending)
+    await _awrite(writer, transform.final())
+
+async def encrypt_stream(reader, writer, fib_method_name='iterative', mode='binary', bits=8,
+                         chunk_size=DEFAULT_CHUNK_SIZE, executor=None, length=None):
+    """
+    reader'dan (StreamReader veya asenkron bayt yineleyicisi) okunan veriyi şifreleyip
+    writer'a (StreamWriter veya write metodu olan nesne) yazar. Olay döngüsü bloklanmaz:
+    dönüşümler executor'da (varsayılan: döngünün iş parçacığı havuzu) çalışır.
+    mode='binary' veya 'modular' (bits=8/32); length bilinmiyorsa başlığa UNKNOWN_LENGTH yazılır.
+    """
+    fib_method_name = resolve_method(fib_method_name, chunk_size if length is None else length)
+    header, bits = _fixed_width_header(mode, bits, fib_method_name, length)
+    fib_method = get_fib_method(FibonacciMethods(), fib_method_name)
+    transform = FixedWidthTransform(FibonacciKeystream(fib_method, modulus=1 << bits), bits)
+    await _awrite(writer, header)
+    await _apump(_aread_chunks(reader, chunk_size), writer, transform, executor)
+
+async def decrypt_stream(reader, writer, fib_method_name=None, chunk_size=DEFAULT_CHUNK_SIZE, executor=None):
+    """
+    encrypt_stream (veya modular/binary dosya) çıktısını asenkron olarak çözer.
+    Biçim ve yöntem başlıktan okunur; ondalık biçim desteklenmez.
+    """
+    chunks = _aread_chunks(reader, chunk_size)
+    first = b''
+    async for chunk in chunks:
+        first += chunk
+        if len(first) >= _BINARY_HEADER.size:
+            break
+    header, head = read_cipher_header(io.BytesIO(first))
+    if header is None:
+        raise ValueError("Akış çözme yalnızca sabit genişlikli (modular, binary) biçimleri destekler")
+    method_name = fib_method_name or header["method"] or 'iterative'
+    fib_method = get_fib_method(FibonacciMethods(), method_name)
+    keystream = FibonacciKeystream(fib_method, modulus=1 << header["bits"])
+    transform = FixedWidthTransform(keystream, header["bits"], decrypt=True, length=header["length"])
+
+    async def body():
+        if len(first) > len(head):
+            yield first[len(head):]
+        async for chunk in chunks:
+            yield chunk
+
+    await _apump(body(), writer, transform, executor)
+
+# Sunucu modu: sıcak tablolarla uzun süre çalışan, çerçeveli protokolle istek yanıtlayan servis
+# Çerçeve: kod (istek: işlem, yanıt: durum), meta uzunluğu, gövde uzunluğu + JSON meta + ham gövde
+_FRAME = struct.Struct("!BII")
+OP_PING, OP_ENCRYPT, OP_DECRYPT, OP_GENPW = range(4)
+STATUS_OK, STATUS_ERROR = 0, 1
+SERVER_MAX_FRAME = 256 * 1024 * 1024  # bayt
+SERVER_MAX_PASSWORDS = 100000         # istek başına şifre
+SERVER_MAX_PASSWORD_LENGTH = 1024     # karakter
+
+@profiled('serialization', lambda code, meta=None, body=b'': len(body))
+def _pack_frame(code, meta=None, body=b''):
+    """Kod, JSON meta ve gövdeyi tek bir çerçeve olarak paketler."""
+    meta = json.dumps(meta, separators=(',', ':')).encode('utf-8') if meta else b''
+    return _FRAME.pack(code, len(meta), len(body)) + meta + body
+
+def _meta_int(meta, key, default, limit):
+    """meta[key] değerinin 1..limit aralığında bir tamsayı olduğunu doğrulayıp döndürür."""
+    value = meta.get(key, default)
+    if type(value) is not int or not 1 <= value <= limit:
+        raise ValueError(f"{key} 1 ile {limit} arasında bir tamsayı olmalı")
+    return value
+
+def _meta_method(meta, default=None):
+    """meta["method"] değerini doğrular; verilmemişse default döner."""
+    method_name = meta.get("method") or default
+    if method_name is not None and method_name not in FIB_METHOD_CHOICES:
+        raise ValueError(f"Bilinmeyen yöntem: {method_name!r}")
+    return method_name
+
+def _serve_request(op, meta, body):
+    """Tek bir sunucu isteğini işler ve (meta, gövde) yanıtını döndürür; yürütücüde çalışır."""
+    if op == OP_PING:
+        return {"pong": True}, b''
+    if op == OP_ENCRYPT:
+        method_name = resolve_method(_meta_method(meta, 'iterative'), len(body))
+        mode = meta.get("mode", 'binary')
+        # Ondalık çıktı girdiyle karesel büyür; servis yalnızca sabit genişlikli biçimleri kabul eder
+        if mode not in ('binary', 'modular'):
+            raise ValueError(f"Servis bu biçimi desteklemiyor: {mode!r} ('binary' veya 'modular' kullanın)")
+        bits = meta.get("bits", 8)
+        if type(bits) is not int or bits not in MODULAR_WIDTHS:
+            raise ValueError(f"bits {MODULAR_WIDTHS} değerlerinden biri olmalı: {bits!r}")
+        fib_method = get_fib_method(FibonacciMethods(), method_name)
+        header, bits = _fixed_width_header(mode, bits, method_name, len(body))
+        transform = FixedWidthTransform(FibonacciKeystream(fib_method, modulus=1 << bits), bits)
+        return {}, header + transform.update(body) + transform.final()
+    if op == OP_DECRYPT:
+        method_name = _meta_method(meta)
+        fib_method = get_fib_method(FibonacciMethods(), method_name, n=len(body)) if method_name else None
+        dst = io.BytesIO()
+        decrypt_fileobj(io.BytesIO(body), dst, fib_method)
+        return {}, dst.getvalue()
+    if op == OP_GENPW:
+        count = _meta_int(meta, "count", 5, SERVER_MAX_PASSWORDS)
+        length = _meta_int(meta, "length", 12, SERVER_MAX_PASSWORD_LENGTH)
+        out = io.StringIO()
+        write_passwords(out, count, length, _meta_method(meta, 'iterative'), min(count, 10000))
+        return {}, out.getvalue().encode('utf-8')
+    raise ValueError(f"Bilinmeyen işlem: {op}")
+
+async def _handle_client(reader, writer, executor):
+    """Bir istemci bağlantısındaki istekleri sırayla yanıtlar; bağlantılar eşzamanlı işlenir."""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                op, meta_len, body_len = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+            except asyncio.IncompleteReadError:
+                break
+            if meta_len + body_len > SERVER_MAX_FRAME:
+                await _awrite(writer, _pack_frame(STATUS_ERROR, {"error": "Çerçeve çok büyük"}))
+                break
+            meta = await reader.readexactly(meta_len)
+            body = await reader.readexactly(body_len)
+            try:
+                meta = json.loads(meta) if meta else {}
+                if not isinstance(meta, dict):
+                    raise ValueError("meta bir JSON nesnesi olmalı")
+                meta, body = await loop.run_in_executor(executor, _serve_request, op, meta, body)
+                await _awrite(writer, _pack_frame(STATUS_OK, meta, body))
+            except Exception as e:
+                await _awrite(writer, _pack_frame(STATUS_ERROR, {"error": str(e)}))
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+def parse_address(address):
+    """'HOST:PORT' adresini (host, port), diğerlerini Unix soket yolu olarak (yol, None) döndürür."""
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit():
+        return host or '127.0.0.1', int(port)
+    return address, None
+
+def _remove_stale_socket(path):
+    """Önceki çalıştırmadan kalan Unix soketini siler; yol soket değilse dokunmadan hata verir."""
+    import stat
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} zaten var ve bir soket değil; üzerine yazılmadı")
+    os.unlink(path)
+
+async def serve(address, workers=1):
+    """
+    Şifreleme servisini address (Unix soket yolu veya HOST:PORT) üzerinde başlatır.
+    Tablolar başlangıçta ısıtılır; CPU işi workers > 1 ise süreç havuzunda,
+    değilse döngünün iş parçacığı havuzunda çalışır.
+    """
+    host, port = parse_address(address)
+    if port is None:
+        _remove_stale_socket(host)
+    get_shared_table()
+    for bits in MODULAR_WIDTHS:
+        get_pisano_table(bits)
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    # Süreç havuzu ısıtılmış tabloları fork ile devralır
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def handler(reader, writer):
+        return _handle_client(reader, writer, executor)
+
+    try:
+        if port is None:
+            server = await asyncio.start_unix_server(handler, path=host)
+        else:
+            server = await asyncio.start_server(handler, host, port)
+        # SIGTERM ile temiz kapanış (soket dosyası ve havuz temizlenir); Windows'ta veya
+        # ana iş parçacığı dışında çalışan döngülerde sinyal işleyicisi kurulamaz
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        if executor:
+            executor.shutdown()
+        if port is None:
+            _remove_stale_socket(host)
+
+class CipherClient:
+    """
+    Sunucu moduna bağlanan senkron istemci. Bağlantı istekler arasında açık
+    tutulur; böylece her çağrı yalnızca bir gidiş-dönüş maliyeti öder.
+    """
+
+    def __init__(self, address, timeout=None):
+        import socket
+        host, port = parse_address(address)
+        if port is None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(host)
+        else:
+            self.sock = socket.create_connection((host, port), timeout)
+
+    def _recv_exactly(self, size):
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.sock.recv(min(size - len(data), DEFAULT_CHUNK_SIZE))
+            if not chunk:
+                raise ConnectionError("Sunucu bağlantıyı kapattı")
+            data += chunk
+        return bytes(data)
+
+    def request(self, op, meta=None, body=b''):
+        """Bir istek gönderir ve (meta, gövde) yanıtını döndürür; sunucu hatasında ValueError yükseltir."""
+        self.sock.sendall(_pack_frame(op, meta, body))
+        status, meta_len, body_len = _FRAME.unpack(self._recv_exactly(_FRAME.size))
+        meta = json.loads(self._recv_exactly(meta_len)) if meta_len else {}
+        body = self._recv_exactly(body_len)
+        if status != STATUS_OK:
+            raise ValueError(meta.get("error", "Sunucu hatası"))
+        return meta, body
+
+    def ping(self):
+        return self.request(OP_PING)[0].get("pong", False)
+
+    def encrypt(self, data, method='iterative', mode='binary', bits=8):
+        return self.request(OP_ENCRYPT, {"method": method, "mode": mode, "bits": bits}, data)[1]
+
+    def decrypt(self, data, method=None):
+        return self.request(OP_DECRYPT, {"method": method} if method else None, data)[1]
+
+    def generate_passwords(self, count=5, length=12, method='iterative'):
+        body = self.request(OP_GENPW, {"count": count, "length": length, "method": method})[1]
+        return body.decode('utf-8').splitlines()
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 def password_generator_mode():
     """
     Password generator mode.
@@ -706,6 +2913,8 @@ def password_generator_mode():
         print(f"{Fore.CYAN}3.{Style.RESET_ALL} Iterative {Fore.GREEN}{LANG['default']}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}4.{Style.RESET_ALL} Matrix Exponentiation")
         print(f"{Fore.CYAN}5.{Style.RESET_ALL} Binet's Formula")
+        print(f"{Fore.CYAN}6.{Style.RESET_ALL} Fast Doubling")
+        print(f"{Fore.CYAN}7.{Style.RESET_ALL} {LANG['method_auto']}")
         
         method_choice = input(f"\n{Fore.YELLOW}{LANG['your_choice']}{Style.RESET_ALL} ").strip() or "3"
         method_map = {
@@ -713,9 +2922,11 @@ def password_generator_mode():
             "2": "memoized",
             "3": "iterative",
             "4": "matrix",
-            "5": "binet"
+            "5": "binet",
+            "6": "fast_doubling",
+            "7": "auto"
         }
-        method = method_map.get(method_choice, "iterative")
+        method = resolve_method(method_map.get(method_choice, "iterative"), length)
         
         print_info(LANG['generating_pwd'].format(method.capitalize(), count, length))
         
@@ -819,6 +3030,8 @@ def file_encryption_mode():
         print(f"{Fore.CYAN}3.{Style.RESET_ALL} Iterative {Fore.GREEN}{LANG['default']}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}4.{Style.RESET_ALL} Matrix Exponentiation")
         print(f"{Fore.CYAN}5.{Style.RESET_ALL} Binet's Formula")
+        print(f"{Fore.CYAN}6.{Style.RESET_ALL} Fast Doubling")
+        print(f"{Fore.CYAN}7.{Style.RESET_ALL} {LANG['method_auto']}")
         
         method_choice = input(f"\n{Fore.YELLOW}{LANG['your_choice']}{Style.RESET_ALL} ").strip() or "3"
         method_map = {
@@ -826,18 +3039,27 @@ def file_encryption_mode():
             "2": "memoized",
             "3": "iterative",
             "4": "matrix",
-            "5": "binet"
+            "5": "binet",
+            "6": "fast_doubling",
+            "7": "auto"
         }
         method = method_map.get(method_choice, "iterative")
         
         if operation == "1":
+            print_section(LANG['format_select'])
+            print(f"{Fore.CYAN}1.{Style.RESET_ALL} {LANG['format_decimal']} {Fore.GREEN}{LANG['default']}{Style.RESET_ALL}")
+            print(f"{Fore.CYAN}2.{Style.RESET_ALL} {LANG['format_modular']}")
+            print(f"{Fore.CYAN}3.{Style.RESET_ALL} {LANG['format_binary']}")
+            format_choice = input(f"\n{Fore.YELLOW}{LANG['your_choice'][:-6]}(1-3):{Style.RESET_ALL} ").strip() or "1"
+            mode = {"2": "modular", "3": "binary"}.get(format_choice, "decimal")
+            
             print_info(LANG['encrypting_file'].format(input_file, method.capitalize()))
             
             # Get file size
             file_size = os.path.getsize(input_file)
             print_info(LANG['file_size'].format(file_size))
             
-            success = encrypt_file(input_file, output_file, method)
+            success = encrypt_file(input_file, output_file, method, mode)
         else:
             print_info(LANG['decrypting_file'].format(input_file, method.capitalize()))
             success = decrypt_file(input_file, output_file, method)
@@ -854,12 +3076,13 @@ def file_encryption_mode():
 
 def generate_optimal_passwords(count=5, length=12):
     """
-    Generates passwords using the optimal Fibonacci algorithm.
+    Measures every engine at the requested length and generates passwords with the fastest correct one.
     """
     clear_screen()
     print_banner("Optimal Algorithm")
     print_header(LANG['opt_title'])
     
+    optimal_passwords, optimal_method = [], None
     try:
         # First get password count and length
         count = int(input(f"{Fore.YELLOW}{LANG['pwd_count']}{Style.RESET_ALL} ").strip() or "5")
@@ -868,145 +3091,56 @@ def generate_optimal_passwords(count=5, length=12):
         length = int(input(f"{Fore.YELLOW}{LANG['pwd_length']}{Style.RESET_ALL} ").strip() or "12")
         length = max(8, min(length, 32))
         
-        # Create text for the desired password
-        password_text = f"Fibonacci password length {length}, password count {count}"
-        
         print_section("ALGORITHM EVALUATION")
         print_info(LANG['opt_evaluating'])
+        evaluation = measure_engines(length)
         
-        # Fibonacci methods
-        fib = FibonacciMethods()
-        
-        # Measurement results
-        results = []
-        
-        # Generate passwords for all algorithms and measure performance
-        methods = [
-            ("Naive Recursion", lambda n: fib.naive_recursive(min(n, 25)), "naive"),
-            ("Memoized Recursion", fib.memoized_recursive, "memoized"),
-            ("Iterative", fib.iterative, "iterative"),
-            ("Matrix Exponentiation", fib.matrix_exponentiation, "matrix"),
-            ("Binet's Formula", fib.binet_formula, "binet")
-        ]
-        
-        all_passwords = {}
-        
-        # Progress bar
-        with tqdm(total=len(methods), desc="Algorithm Test", bar_format="{l_bar}%s{bar}%s{r_bar}" % (Fore.BLUE, Fore.RESET)) as pbar:
-            # Measure each method and generate passwords
-            for method_name, method_func, method_key in methods:
-                print(f"{Fore.CYAN}» {method_name}{Style.RESET_ALL} {LANG['opt_generating'].format(method_name)}...")
-                
-                # Measure algorithm performance
-                start_time = time.time()
-                tracemalloc.start()
-                
-                # Generate passwords with this algorithm
-                sub_pbar_desc = f"{method_name} passwords"
-                with tqdm(total=count, desc=sub_pbar_desc, leave=False, bar_format="{l_bar}%s{bar}%s{r_bar}" % (Fore.GREEN, Fore.RESET)) as sub_pbar:
-                    passwords = []
-                    for _ in range(count):
-                        password = generate_password_fibonacci(length, method_key)
-                        passwords.append(password)
-                        sub_pbar.update(1)
-                
-                all_passwords[method_key] = passwords
-                
-                # Complete memory and time measurements
-                current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
-                end_time = time.time()
-                
-                # Save results
-                result = {
-                    "method": method_name,
-                    "key": method_key,
-                    "time": end_time - start_time,
-                    "memory_current": current / 1024,  # KB
-                    "memory_peak": peak / 1024,  # KB
-                }
-                results.append(result)
-                
-                pbar.update(1)
-        
-        # Theoretical time complexity scores (0-10, higher is better)
-        time_complexity_scores = {
-            "naive": 1,       # O(2^n) - worst
-            "memoized": 6,    # O(n) - medium
-            "iterative": 7,   # O(n) - medium but constant space
-            "matrix": 8,      # O(log n) - good
-            "binet": 10       # O(1) - theoretically best
+        method_names = {
+            "naive": "Naive Recursion",
+            "memoized": "Memoized Recursion",
+            "iterative": "Iterative",
+            "matrix": "Matrix Exponentiation",
+            "binet": "Binet's Formula",
+            "fast_doubling": "Fast Doubling"
         }
         
-        # Normalize practical test results (0-10, higher is better)
-        # Time: Lower is better
-        min_time = min(r["time"] for r in results)
-        max_time = max(r["time"] for r in results)
-        time_range = max_time - min_time if max_time > min_time else 1
-        
-        # Memory: Lower is better
-        min_memory = min(r["memory_peak"] for r in results)
-        max_memory = max(r["memory_peak"] for r in results)
-        memory_range = max_memory - min_memory if max_memory > min_memory else 1
-        
-        # Calculate total score for each algorithm
-        for result in results:
-            # Normalized time score (0-10)
-            if time_range > 0:
-                time_score = 10 - ((result["time"] - min_time) / time_range) * 10
-            else:
-                time_score = 10
-            
-            # Normalized memory score (0-10)
-            if memory_range > 0:
-                memory_score = 10 - ((result["memory_peak"] - min_memory) / memory_range) * 10
+        # Ölçülen motorlar süreye göre, atlananlar en sonda
+        ranked = sorted(evaluation["engines"].items(),
+                        key=lambda item: (item[1].get("median_ns") is None, item[1].get("median_ns") or 0))
+        table_data = []
+        for key, entry in ranked:
+            if entry.get("median_ns") is not None:
+                status = "✓"
+                median, p95 = f"{entry['median_ns'] / 1000:.2f}", f"{entry['p95_ns'] / 1000:.2f}"
             else:
-                memory_score = 10
-            
-            # Theoretical complexity score
-            complexity_score = time_complexity_scores[result["key"]]
-            
-            # Total score (weighted average)
-            # Practical performance may be more important than theoretical
-            # Time: 40%, Memory: 30%, Theoretical Complexity: 30%
-            total_score = (time_score * 0.4) + (memory_score * 0.3) + (complexity_score * 0.3)
-            
-            result["time_score"] = time_score
-            result["memory_score"] = memory_score
-            result["complexity_score"] = complexity_score
-            result["total_score"] = total_score
+                status = LANG['skipped'] if entry.get("skipped") else "✗"
+                median = p95 = "-"
+            table_data.append([method_names.get(key, key), median, p95, status, time_complexity_map(key)])
         
-        # Sort results by score
-        sorted_results = sorted(results, key=lambda x: x["total_score"], reverse=True)
+        headers = [LANG['header_method'], LANG['header_median_us'], LANG['header_p95_us'],
+                   LANG['header_accuracy'], LANG['header_complexity']]
+        print_header(LANG['opt_comparison'].format(length))
+        print(tabulate(table_data, headers=headers, tablefmt="grid", disable_numparse=True))
         
-        # Show results as a table
-        headers = [LANG['header_method'], LANG['header_time'], LANG['header_memory_peak'], LANG['header_complexity'], "Total Score"]
-        table_data = [
-            [
-                f"{r['method']}", 
-                f"{r['time']:.6f}", 
-                f"{r['memory_peak']:.2f}", 
-                time_complexity_map(r["key"]), 
-                f"{r['total_score']:.2f}"
-            ]
-            for r in sorted_results
-        ]
+        optimal_method = evaluation["winner"]
+        best = evaluation["engines"].get(optimal_method, {})
         
-        print_header(LANG['opt_comparison'])
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
-        
-        # Highest scoring algorithm
-        best_algorithm = sorted_results[0]
-        optimal_method = best_algorithm["key"]
+        # Yalnızca seçilen motorla üret; bellek ayrı bir geçişte ölçülür
+        started = time.perf_counter()
+        optimal_passwords = generate_passwords(count, length, optimal_method)
+        elapsed = time.perf_counter() - started
+        rss = measure_rss(lambda: generate_passwords(count, length, optimal_method))
+        _, peak = measure_memory(lambda: generate_passwords(count, length, optimal_method))
         
         print_header(LANG['opt_result'])
-        print_success(LANG['opt_algorithm'].format(best_algorithm['method'], best_algorithm['total_score']))
+        print_success(LANG['opt_algorithm'].format(method_names[optimal_method], length))
         print_success(LANG['opt_complexity'].format(time_complexity_map(optimal_method)))
-        print_success(LANG['opt_time'].format(best_algorithm['time']))
-        print_success(LANG['opt_memory'].format(best_algorithm['memory_peak']))
-        
-        # Show passwords generated with the optimal algorithm
-        optimal_passwords = all_passwords[optimal_method]
+        if best.get("median_ns") is not None:
+            print_success(LANG['opt_engine_time'].format(best["median_ns"] / 1000, length))
+        print_success(LANG['opt_time'].format(elapsed))
+        print_success(LANG['opt_memory'].format(peak / 1024))
+        if rss["rss_peak_delta"] is not None:
+            print_success(LANG['opt_rss'].format(rss["rss_peak_delta"] / 1024))
         
         print_header(LANG['opt_passwords'])
         
@@ -1040,10 +3174,10 @@ def generate_optimal_passwords(count=5, length=12):
         # Automatically save passwords
         filename = f"optimal_passwords_{optimal_method}.txt"
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"# Optimal Fibonacci Algorithm ({best_algorithm['method']}) Generated Passwords\n\n")
+            f.write(f"# Optimal Fibonacci Algorithm ({method_names[optimal_method]}) Generated Passwords\n\n")
             f.write(f"Theoretical Complexity: {time_complexity_map(optimal_method)}\n")
-            f.write(f"Time: {best_algorithm['time']:.6f} seconds\n")
-            f.write(f"Memory Usage: {best_algorithm['memory_peak']:.2f} KB\n\n")
+            f.write(f"Time: {elapsed:.6f} seconds\n")
+            f.write(f"Memory Usage: {peak / 1024:.2f} KB\n\n")
             
             for i, password in enumerate(optimal_passwords, 1):
                 analysis = analyze_password_strength(password)
@@ -1051,19 +3185,19 @@ def generate_optimal_passwords(count=5, length=12):
         
         print_success(LANG['pwd_saved'].format(filename))
         
-        # Optionally save passwords from all algorithms
+        # Optionally generate and save passwords with the other correct engines
         save_all = input(f"\n{Fore.YELLOW}{LANG['save_all']}{Style.RESET_ALL} ").strip().lower()
         if save_all in ('y', 'e', 'yes', 'evet'):
-            for method_key, passwords in all_passwords.items():
-                if method_key != optimal_method:  # Already saved the optimal method
-                    filename = f"passwords_{method_key}.txt"
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        method_name = next(m[0] for m in methods if m[2] == method_key)
-                        f.write(f"# {method_name} Algorithm Generated Passwords\n\n")
-                        for i, password in enumerate(passwords, 1):
-                            analysis = analyze_password_strength(password)
-                            f.write(f"{i}. {password} - {analysis['strength']}\n")
-                    print_success(LANG['alg_passwords_saved'].format(method_name, filename))
+            for method_key, entry in evaluation["engines"].items():
+                if method_key == optimal_method or not entry.get("correct"):
+                    continue
+                filename = f"passwords_{method_key}.txt"
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(f"# {method_names[method_key]} Algorithm Generated Passwords\n\n")
+                    for i, password in enumerate(generate_passwords(count, length, method_key), 1):
+                        analysis = analyze_password_strength(password)
+                        f.write(f"{i}. {password} - {analysis['strength']}\n")
+                print_success(LANG['alg_passwords_saved'].format(method_names[method_key], filename))
                     
     except Exception as e:
         print_error(LANG['unexpected_error'].format(e))
@@ -1081,27 +3215,352 @@ def time_complexity_map(method_key):
         "memoized": "O(n)",
         "iterative": "O(n)",
         "matrix": "O(log n)",
-        "binet": "O(1)"
+        "binet": "O(1)",
+        "fast_doubling": "O(log n)"
     }
     return complexity_map.get(method_key, "Bilinmiyor")
 
+def run_bulk_password_command(args):
+    """
+    Non-interactive bulk password generation (--bulk-passwords N).
+    Writes one password per line to --output or stdout. Returns the process exit code.
+    """
+    if args.length < 1:
+        print_error(LANG['valid_numbers'])
+        return 1
+    
+    method = args.method or 'iterative'
+    if args.output and args.output != '-':
+        with open(args.output, 'w', encoding='utf-8') as f:
+            write_passwords(f, args.bulk_passwords, args.length, method, args.batch_size)
+    else:
+        write_passwords(sys.stdout, args.bulk_passwords, args.length, method, args.batch_size)
+        sys.stdout.flush()
+    return 0
+
+def parse_range(value):
+    """'START:END' biçimindeki aralığı (start, end) olarak ayrıştırır; END boş bırakılabilir."""
+    start, sep, end = value.partition(':')
+    try:
+        start = int(start) if start else 0
+        end = int(end) if end else None
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range: {value!r} (expected START:END)")
+    if not sep or start < 0 or (end is not None and end < start):
+        raise argparse.ArgumentTypeError(f"invalid range: {value!r} (expected START:END)")
+    return start, end
+
+def run_range_command(args):
+    """
+    Non-interactive partial decryption (--decrypt-file INPUT --range START:END).
+    Writes the decrypted range to --output or stdout. Returns the process exit code.
+    """
+    try:
+        data = decrypt_range(args.decrypt_file, *args.range, fib_method_name=args.method)
+    except (OSError, ValueError) as e:
+        print_error(LANG['unexpected_error'].format(e))
+        return 1
+    if args.output and args.output != '-':
+        with open(args.output, 'wb') as f:
+            f.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+    return 0
+
+def run_file_command(args):
+    """
+    Non-interactive file encryption/decryption (--encrypt-file / --decrypt-file).
+    Returns the process exit code.
+    """
+    input_file = args.encrypt_file or args.decrypt_file
+    if not os.path.exists(input_file):
+        print_error(LANG['file_not_found'].format(input_file))
+        return 1
+    
+    if args.range and args.decrypt_file:
+        return run_range_command(args)
+    
+    if args.in_place:
+        try:
+            crypt_file_inplace(input_file, args.method or 'iterative', decrypt=bool(args.decrypt_file))
+        except (OSError, ValueError) as e:
+            print_error(LANG['unexpected_error'].format(e))
+            return 1
+        return 0
+    
+    if args.encrypt_file:
+        output_file = args.output or input_file + ".enc"
+        success = encrypt_file(input_file, output_file, args.method or 'iterative', args.format, args.bits,
+                               args.chunk_size, args.workers, args.mmap)
+    else:
+        output_file = args.output or input_file + ".dec"
+        success = decrypt_file(input_file, output_file, args.method, args.chunk_size, args.workers,
+                               args.mmap)
+    
+    return 0 if success else 1
+
+def run_batch_command(args):
+    """
+    Non-interactive batch encryption/decryption (--batch-encrypt / --batch-decrypt).
+    Returns the process exit code (1 if any file failed).
+    """
+    if args.resume and not args.manifest:
+        print_error("--resume requires --manifest")
+        return 2
+    
+    operation = 'encrypt' if args.batch_encrypt else 'decrypt'
+    result = batch_crypt(args.batch_encrypt or args.batch_decrypt, operation, args.method, args.format,
+                         args.bits, args.output_dir, args.manifest, args.resume, args.workers,
+                         args.chunk_size)
+    for record in result["failed"]:
+        print_error(LANG['batch_failed'].format(record["path"], record["error"]))
+    print_info(LANG['batch_summary'].format(result["processed"], result["skipped"], len(result["failed"])))
+    return 1 if result["failed"] else 0
+
+def run_scaling_command(args):
+    """
+    Non-interactive scaling benchmark (--benchmark-scaling).
+    Prints the fitted exponents, writes the results as JSON and, with --baseline,
+    returns 1 when any series regressed by more than --threshold.
+    """
+    print_info(LANG['sweep_running'])
+    results = run_scaling_benchmark()
+    
+    table_data = []
+    for group in ("engines", "cipher"):
+        for name, series in results[group].items():
+            exponent = series["exponent"]
+            largest = series["points"][-1] if series["points"] else None
+            table_data.append([name, "-" if exponent is None else f"{exponent:.2f}", len(series["points"]),
+                               "-" if largest is None else largest["n"],
+                               "-" if largest is None else f"{largest['median_ns'] / 1e6:.4f}"])
+    print(tabulate(table_data, headers=[LANG['header_series'], LANG['header_exponent'], LANG['header_points'],
+                                        "n (max)", LANG['header_median_ms']], tablefmt="grid"))
+    
+    with open(args.scaling_output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print_success(LANG['results_saved'].format(args.scaling_output))
+    
+    if not args.baseline:
+        return 0
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print_error(LANG['unexpected_error'].format(e))
+        return 2
+    
+    regressions = compare_scaling(results, baseline, args.threshold)
+    for r in regressions:
+        if r["kind"] == "exponent":
+            print_error(LANG['scaling_exponent_regression'].format(r["name"], r["baseline"], r["current"]))
+        else:
+            print_error(LANG['scaling_time_regression'].format(r["name"], r["n"], r["baseline"] / 1e6,
+                                                               r["current"] / 1e6, r["ratio"]))
+    if regressions:
+        return 1
+    print_success(LANG['scaling_ok'].format(args.threshold, args.baseline))
+    return 0
+
+def _memory_table(rows):
+    """benchmark_memory satırlarını (başlıklar, tablo) olarak biçimlendirir; baytlar KB gösterilir."""
+    headers = [LANG['header_method'], "n", LANG['header_memo'], LANG['header_memo_entries'],
+               LANG['header_retained'], LANG['header_memory_peak'], LANG['header_rss_delta'], LANG['header_top_site']]
+    table = []
+    for row in rows:
+        if row.get("skipped"):
+            table.append([row["engine"], row["n"], LANG['skipped'], "-", "-", "-", "-", "-"])
+            continue
+        rss_delta = row.get("rss_peak_delta")
+        site = row["top_sites"][0] if row["top_sites"] else None
+        table.append([row["engine"], row["n"], f"{row['memo_bytes'] / 1024:.1f}", row["memo_entries"],
+                      f"{row['retained_bytes'] / 1024:.1f}", f"{row['peak_bytes'] / 1024:.1f}",
+                      "-" if rss_delta is None else f"{rss_delta / 1024:.1f}",
+                      "-" if site is None else f"{site['site']} ({site['bytes'] / 1024:.1f} KB)"])
+    return headers, table
+
+def run_memory_command(args):
+    """
+    Non-interactive memory report (--benchmark-memory [FILE]).
+    Measures process RSS and a tracemalloc breakdown per engine in separate passes,
+    prints them and writes the rows as JSON to FILE.
+    """
+    print_info(LANG['memory_running'])
+    rows = benchmark_memory()
+    headers, table = _memory_table(rows)
+    print(tabulate(table, headers=headers, tablefmt="grid", disable_numparse=True))
+    
+    data = {"python": platform.python_version(), "machine": platform.machine(),
+            "rss_source": next((row["source"] for row in rows if row.get("source")), None), "engines": rows}
+    with open(args.benchmark_memory, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    print_success(LANG['results_saved'].format(args.benchmark_memory))
+    return 0
+
+HEADLESS_COMMANDS = ('encrypt', 'decrypt', 'genpw')
+
+def run_headless(argv):
+    """
+    Headless subcommands (encrypt, decrypt, genpw) for scripts, cron and CI.
+    Skips the UI libraries, the banner and screen clearing; with --timing the
+    module import and command times are reported on stderr.
+    Returns the process exit code.
+    """
+    started = time.perf_counter()
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--timing', action='store_true', help='Report startup and run time on stderr')
+    common.add_argument('--language', '-l', choices=['en', 'tr'], default='en')
+    common.add_argument('--profile', metavar='FILE', default=PROFILE_PATH,
+                        help='Write per-stage counters as JSON, or a cProfile dump for .pstats/.prof, to FILE')
+    parser = argparse.ArgumentParser(prog="fibonacci_cipher.py",
+                                     description="Headless Fibonacci cipher commands")
+    commands = parser.add_subparsers(dest='command')
+    
+    encrypt_parser = commands.add_parser('encrypt', parents=[common], help='Encrypt a file')
+    encrypt_parser.add_argument('encrypt_file', metavar='INPUT')
+    encrypt_parser.add_argument('--format', choices=['decimal', 'modular', 'binary'], default='binary')
+    encrypt_parser.add_argument('--bits', type=int, choices=MODULAR_WIDTHS, default=8)
+    encrypt_parser.set_defaults(decrypt_file=None, range=None)
+    
+    decrypt_parser = commands.add_parser('decrypt', parents=[common], help='Decrypt a file (format is detected)')
+    decrypt_parser.add_argument('decrypt_file', metavar='INPUT')
+    decrypt_parser.add_argument('--range', type=parse_range, metavar='START:END')
+    decrypt_parser.set_defaults(encrypt_file=None)
+    
+    for file_parser in (encrypt_parser, decrypt_parser):
+        file_parser.add_argument('--output', '-o', metavar='OUTPUT')
+        file_parser.add_argument('--method', '-m', choices=FIB_METHOD_CHOICES)
+        file_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        file_parser.add_argument('--workers', type=int, default=1)
+        file_parser.add_argument('--mmap', action='store_true')
+        file_parser.add_argument('--in-place', action='store_true')
+    
+    genpw_parser = commands.add_parser('genpw', parents=[common], help='Generate passwords, one per line')
+    genpw_parser.add_argument('bulk_passwords', type=int, metavar='COUNT', nargs='?', default=1)
+    genpw_parser.add_argument('--length', type=int, default=12)
+    genpw_parser.add_argument('--method', '-m', choices=FIB_METHOD_CHOICES)
+    genpw_parser.add_argument('--batch-size', type=int, default=10000)
+    genpw_parser.add_argument('--output', '-o', metavar='OUTPUT')
+    
+    args = parser.parse_args(argv)
+    set_language(args.language)
+    if args.profile:
+        start_profiling(args.profile)
+    if args.command == 'genpw':
+        code = run_bulk_password_command(args)
+    else:
+        code = run_file_command(args)
+    
+    if args.timing:
+        finished = time.perf_counter()
+        sys.stderr.write(f"startup: import {(_IMPORT_FINISHED - _IMPORT_STARTED) * 1000:.1f} ms, "
+                         f"command {(finished - started) * 1000:.1f} ms\n")
+    return code
+
 def main():
-    clear_screen()
-    print_banner("Fibonacci Cipher")
+    if len(sys.argv) > 1 and sys.argv[1] in HEADLESS_COMMANDS:
+        sys.exit(run_headless(sys.argv[1:]))
     
     parser = argparse.ArgumentParser(description="Fibonacci Encryption and Password Generator")
     parser.add_argument('--benchmark', action='store_true', help='Run performance benchmark')
+    parser.add_argument('--benchmark-scaling', action='store_true',
+                      help='Measure engines and the cipher across geometric sizes and fit scaling exponents')
+    parser.add_argument('--scaling-output', metavar='FILE', default='benchmark_scaling.json',
+                      help='JSON file for --benchmark-scaling results (default: benchmark_scaling.json)')
+    parser.add_argument('--baseline', metavar='FILE',
+                      help='Compare --benchmark-scaling results with FILE and exit 1 on regression')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                      help='Allowed slowdown ratio for --baseline (default: 0.5 = 50%%)')
+    parser.add_argument('--benchmark-memory', nargs='?', const='benchmark_memory.json', metavar='FILE',
+                      help='Measure process RSS and a per-engine tracemalloc breakdown (memo, result, '
+                           'retained, peak) in separate passes and write JSON to FILE '
+                           '(default: benchmark_memory.json)')
     parser.add_argument('--generate', action='store_true', help='Start password generator mode')
     parser.add_argument('--encrypt', action='store_true', help='Start file encryption mode')
     parser.add_argument('--optimal', action='store_true', help='Find optimal algorithm and generate passwords')
     parser.add_argument('--language', '-l', choices=['en', 'tr'], default='en', 
                       help='Select language (en: English, tr: Turkish)')
+    parser.add_argument('--profile', metavar='FILE', default=PROFILE_PATH,
+                      help='Record per-stage counters (Fibonacci compute, transform, serialization, file I/O, '
+                           'strength analysis) and write them as JSON to FILE on exit; '
+                           'a .pstats/.prof FILE gets a cProfile dump of the run instead')
+    
+    # Non-interactive (streaming) file operations
+    file_group = parser.add_mutually_exclusive_group()
+    file_group.add_argument('--encrypt-file', metavar='INPUT', help='Encrypt INPUT without interactive prompts')
+    file_group.add_argument('--decrypt-file', metavar='INPUT', help='Decrypt INPUT without interactive prompts')
+    parser.add_argument('--output', '-o', metavar='OUTPUT',
+                      help='Output file (default: INPUT.enc / INPUT.dec)')
+    parser.add_argument('--method', '-m', choices=FIB_METHOD_CHOICES,
+                      help='Fibonacci method (default: iterative, or the one stored in a binary file header)')
+    parser.add_argument('--format', choices=['decimal', 'modular', 'binary'], default='binary',
+                      help='Encrypted file format (default: binary)')
+    parser.add_argument('--bits', type=int, choices=MODULAR_WIDTHS, default=8,
+                      help='Symbol width for the modular format (default: 8)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                      help=f'Read size in bytes for streaming (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--workers', type=int, default=1,
+                      help='Worker processes for fixed-width formats and batch mode (default: 1)')
+    parser.add_argument('--mmap', action='store_true',
+                      help='Use memory-mapped I/O for byte-oriented formats (binary, 8-bit modular)')
+    parser.add_argument('--in-place', action='store_true',
+                      help='Transform INPUT in place as a headerless byte stream (implies --mmap)')
+    parser.add_argument('--range', type=parse_range, metavar='START:END',
+                      help='With --decrypt-file: decrypt only bytes [START, END) of a modular/binary file '
+                           '(characters for 32-bit files); writes to --output or stdout')
+    
+    # Non-interactive batch (directory / glob) operations
+    file_group.add_argument('--batch-encrypt', nargs='+', metavar='PATH',
+                      help='Encrypt every file in the given directories or glob patterns')
+    file_group.add_argument('--batch-decrypt', nargs='+', metavar='PATH',
+                      help='Decrypt every file in the given directories or glob patterns')
+    parser.add_argument('--output-dir', metavar='DIR',
+                      help='Directory for batch outputs (default: next to each input)')
+    parser.add_argument('--manifest', metavar='FILE',
+                      help='Append one JSON line per processed file (path, size, method, duration, checksum)')
+    parser.add_argument('--serve', metavar='ADDRESS',
+                      help='Run as a long-lived cipher service on a Unix socket path or HOST:PORT')
+    parser.add_argument('--resume', action='store_true',
+                      help='Skip files the manifest already lists as done and unchanged')
+    
+    # Non-interactive bulk password generation
+    parser.add_argument('--bulk-passwords', type=int, metavar='N',
+                      help='Generate N passwords to --output (or stdout, one per line) without prompts')
+    parser.add_argument('--length', type=int, default=12, help='Password length for --bulk-passwords (default: 12)')
+    parser.add_argument('--batch-size', type=int, default=10000,
+                      help='Passwords generated per batch for --bulk-passwords (default: 10000)')
     
     args = parser.parse_args()
     
     # Set language
     language = args.language
     set_language(language)
+    if args.profile:
+        start_profiling(args.profile)
+    
+    if args.encrypt_file or args.decrypt_file:
+        sys.exit(run_file_command(args))
+    if args.batch_encrypt or args.batch_decrypt:
+        sys.exit(run_batch_command(args))
+    if args.benchmark_scaling:
+        sys.exit(run_scaling_command(args))
+    if args.benchmark_memory:
+        sys.exit(run_memory_command(args))
+    if args.serve:
+        import asyncio
+        print_info(f"Listening on {args.serve}")
+        try:
+            asyncio.run(serve(args.serve, args.workers))
+        except OSError as e:
+            print_error(str(e))
+            sys.exit(1)
+        return
+    if args.bulk_passwords is not None:
+        sys.exit(run_bulk_password_command(args))
+    
+    clear_screen()
+    print_banner("Fibonacci Cipher")
     
     if args.benchmark:
         performance_benchmark()
@@ -1209,6 +3668,31 @@ def set_language(lang_code):
             'header_memory_current': "Anlık Bellek (KB)",
             'header_memory_peak': "Tepe Bellek (KB)",
             'header_accuracy': "Doğruluk",
+            'header_p95': "p95 (saniye)",
+            'header_stdev': "Std. Sapma (saniye)",
+            'header_median_ms': "Medyan (ms)",
+            'header_p95_ms': "p95 (ms)",
+            'header_stdev_ms': "Std. Sapma (ms)",
+            'header_median_us': "Medyan (µs)",
+            'header_p95_us': "p95 (µs)",
+            'header_rss_delta': "RSS Tepe Artışı (KB)",
+            'header_memo': "Memo (KB)",
+            'header_memo_entries': "Memo Kayıtları",
+            'header_retained': "Tutulan (KB)",
+            'header_top_site': "En Büyük Ayırma",
+            'memory_breakdown_title': "BELLEK DÖKÜMÜ: F(n) SONRASI TUTULAN BELLEK",
+            'memory_running': "Bellek ölçülüyor (RSS ve tracemalloc ayrı geçişlerde)...",
+            'header_format': "Biçim",
+            'skipped': "atlandı",
+            'sweep_running': "Boyut taraması çalışıyor (n = 10 … 10⁶)...",
+            'header_exponent': "Ölçülen Üs",
+            'header_series': "Seri",
+            'header_points': "Nokta",
+            'scaling_time_regression': "Gerileme: {} n={}: {:.4f} ms → {:.4f} ms ({:.2f}x)",
+            'scaling_exponent_regression': "Üs gerilemesi: {}: n^{:.2f} → n^{:.2f}",
+            'scaling_ok': "{:.0%} eşiğinin üzerinde gerileme yok ({} ile karşılaştırıldı).",
+            'sweep_engines_title': "YÖNTEM TARAMASI: F(n) HESABI",
+            'sweep_cipher_title': "ŞİFRELEME TARAMASI: n SEMBOLLÜK GİDİŞ-DÖNÜŞ",
             'header_algorithm': "Algoritma",
             'header_complexity': "Zaman Karmaşıklığı",
             'header_description': "Açıklama",
@@ -1225,8 +3709,9 @@ def set_language(lang_code):
             'pwd_count': "Kaç şifre üretilsin? (1-10):",
             'pwd_length': "Şifre uzunluğu kaç karakter olsun? (8-32):",
             'method_select': "FİBONACCİ METODU SEÇİMİ",
+            'method_auto': "Otomatik (fast doubling)",
             'default': "(Varsayılan)",
-            'your_choice': "Seçiminiz (1-5):",
+            'your_choice': "Seçiminiz (1-7):",
             'generating_pwd': "{} metodu kullanılarak {} adet {} karakterlik şifre üretiliyor...",
             'pwd_generated': "ÜRETİLEN ŞİFRELER",
             'pwd_analysis': "ŞİFRE ANALİZİ",
@@ -1258,23 +3743,45 @@ def set_language(lang_code):
             'success': "İşlem başarıyla tamamlandı!",
             'output_file_result': "Çıkış dosyası: {}",
             'failure': "İşlem başarısız oldu!",
+            'format_select': "ŞİFRELİ DOSYA BİÇİMİ",
+            'format_decimal': "Ondalık (eski biçim)",
+            'format_modular': "Modüler (sabit genişlikli, açık metinle aynı boyutta)",
+            'format_binary': "İkili (her tür dosya: arşiv, resim, veritabanı dökümü)",
+            'batch_summary': "{} dosya işlendi, {} atlandı, {} başarısız.",
+            'batch_failed': "Başarısız: {} ({})",
             
             # Password strength
             'weak': "Zayıf",
             'medium': "Orta",
             'strong': "Güçlü",
             'very_strong': "Çok Güçlü",
+            'fb_too_short': "Şifre çok kısa, güvenli değil!",
+            'fb_short': "Şifre kısa, en az 8 karakter olmalı.",
+            'fb_length_ok': "Şifre uzunluğu yeterli.",
+            'fb_no_lower': "Küçük harf içermiyor.",
+            'fb_no_upper': "Büyük harf içermiyor.",
+            'fb_no_digit': "Rakam içermiyor.",
+            'fb_no_special': "Özel karakter içermiyor.",
+            'fb_many_repeats': "Çok fazla tekrarlayan karakter içeriyor.",
+            'fb_some_repeats': "Bazı karakterler tekrarlanıyor.",
+            'fb_sequential': "Ardışık karakterler içeriyor (örnek: abc, 123).",
+            'fb_low_entropy': "Karakter dağılımı çeşitli değil.",
+            'fb_increase_length': "Şifre uzunluğunu artırın (en az 12 karakter).",
+            'fb_use_all_classes': "Küçük harf, büyük harf, rakam ve özel karakter kullanın.",
+            'fb_avoid_repeats': "Daha çeşitli karakterler kullanın, tekrarlardan kaçının.",
+            'fb_avoid_sequential': "Ardışık karakterler yerine rastgele karakterler kullanın.",
             
             # Optimal algorithm
             'opt_title': "OPTİMUM FİBONACCİ ŞİFRE ÜRETECİ",
-            'opt_evaluating': "En optimum algoritma değerlendiriliyor...",
-            'opt_generating': "{} ile şifreler üretiliyor...",
-            'opt_comparison': "ALGORİTMA KARŞILAŞTIRMASI",
+            'opt_evaluating': "Algoritmalar bu makinede ölçülüyor...",
+            'opt_comparison': "ALGORİTMA KARŞILAŞTIRMASI (n = {})",
             'opt_result': "SONUÇ",
-            'opt_algorithm': "En optimum algoritma: {} (Skor: {:.2f})",
+            'opt_algorithm': "En hızlı doğru algoritma: {} (n = {})",
             'opt_complexity': "Teorik Karmaşıklık: {}",
+            'opt_engine_time': "F(n) hesabı: {:.2f} µs (n = {})",
             'opt_time': "Süre: {:.6f} saniye",
             'opt_memory': "Bellek Kullanımı: {:.2f} KB",
+            'opt_rss': "Süreç RSS artışı: {:.2f} KB",
             'opt_passwords': "PASSWORDS GENERATED WITH OPTIMAL ALGORITHM",
             'save_all': "Tüm algoritmaların ürettiği şifreleri de kaydetmek ister misiniz? (E/H):",
             'alg_passwords_saved': "{} algoritmasının şifreleri {} dosyasına kaydedildi."
@@ -1306,6 +3813,31 @@ def set_language(lang_code):
             'header_memory_current': "Current Memory (KB)",
             'header_memory_peak': "Peak Memory (KB)",
             'header_accuracy': "Accuracy",
+            'header_p95': "p95 (seconds)",
+            'header_stdev': "Std Dev (seconds)",
+            'header_median_ms': "Median (ms)",
+            'header_p95_ms': "p95 (ms)",
+            'header_stdev_ms': "Std Dev (ms)",
+            'header_median_us': "Median (µs)",
+            'header_p95_us': "p95 (µs)",
+            'header_rss_delta': "RSS Peak Δ (KB)",
+            'header_memo': "Memo (KB)",
+            'header_memo_entries': "Memo Entries",
+            'header_retained': "Retained (KB)",
+            'header_top_site': "Top Allocation",
+            'memory_breakdown_title': "MEMORY BREAKDOWN: HELD AFTER F(n)",
+            'memory_running': "Measuring memory (RSS and tracemalloc in separate passes)...",
+            'header_format': "Format",
+            'skipped': "skipped",
+            'sweep_running': "Running size sweep (n = 10 … 10⁶)...",
+            'header_exponent': "Measured Exponent",
+            'header_series': "Series",
+            'header_points': "Points",
+            'scaling_time_regression': "Regression: {} n={}: {:.4f} ms → {:.4f} ms ({:.2f}x)",
+            'scaling_exponent_regression': "Exponent regression: {}: n^{:.2f} → n^{:.2f}",
+            'scaling_ok': "No regressions above {:.0%} (compared with {}).",
+            'sweep_engines_title': "ENGINE SWEEP: COMPUTING F(n)",
+            'sweep_cipher_title': "CIPHER SWEEP: ROUND TRIP OF n SYMBOLS",
             'header_algorithm': "Algorithm",
             'header_complexity': "Time Complexity",
             'header_description': "Description",
@@ -1322,8 +3854,9 @@ def set_language(lang_code):
             'pwd_count': "How many passwords to generate? (1-10):",
             'pwd_length': "Password length (characters)? (8-32):",
             'method_select': "FIBONACCI METHOD SELECTION",
+            'method_auto': "Auto (fast doubling)",
             'default': "(Default)",
-            'your_choice': "Your choice (1-5):",
+            'your_choice': "Your choice (1-7):",
             'generating_pwd': "Generating {} passwords of {} characters using {} method...",
             'pwd_generated': "GENERATED PASSWORDS",
             'pwd_analysis': "PASSWORD ANALYSIS",
@@ -1355,28 +3888,52 @@ def set_language(lang_code):
             'success': "Operation completed successfully!",
             'output_file_result': "Output file: {}",
             'failure': "Operation failed!",
+            'format_select': "ENCRYPTED FILE FORMAT",
+            'format_decimal': "Decimal (legacy format)",
+            'format_modular': "Modular (fixed-width, same size as plaintext)",
+            'format_binary': "Binary (any file: archives, images, database dumps)",
+            'batch_summary': "{} files processed, {} skipped, {} failed.",
+            'batch_failed': "Failed: {} ({})",
             
             # Password strength
             'weak': "Weak",
             'medium': "Medium", 
             'strong': "Strong",
             'very_strong': "Very Strong",
+            'fb_too_short': "Password is too short, not secure!",
+            'fb_short': "Password is short, should be at least 8 characters.",
+            'fb_length_ok': "Password length is sufficient.",
+            'fb_no_lower': "Doesn't contain lowercase letters.",
+            'fb_no_upper': "Doesn't contain uppercase letters.",
+            'fb_no_digit': "Doesn't contain numbers.",
+            'fb_no_special': "Doesn't contain special characters.",
+            'fb_many_repeats': "Contains too many repeated characters.",
+            'fb_some_repeats': "Some characters are repeated.",
+            'fb_sequential': "Contains sequential characters (e.g.: abc, 123).",
+            'fb_low_entropy': "Character distribution is not diverse.",
+            'fb_increase_length': "Increase password length (at least 12 characters).",
+            'fb_use_all_classes': "Use lowercase, uppercase, numbers and special characters.",
+            'fb_avoid_repeats': "Use more diverse characters, avoid repetitions.",
+            'fb_avoid_sequential': "Use random characters instead of sequential ones.",
             
             # Optimal algorithm
             'opt_title': "OPTIMAL FIBONACCI PASSWORD GENERATOR",
-            'opt_evaluating': "Evaluating the optimal algorithm...",
-            'opt_generating': "Generating passwords with {}...",
-            'opt_comparison': "ALGORITHM COMPARISON",
+            'opt_evaluating': "Measuring the algorithms on this machine...",
+            'opt_comparison': "ALGORITHM COMPARISON (n = {})",
             'opt_result': "RESULT",
-            'opt_algorithm': "Optimal algorithm: {} (Score: {:.2f})",
+            'opt_algorithm': "Fastest correct algorithm: {} (n = {})",
             'opt_complexity': "Theoretical Complexity: {}",
+            'opt_engine_time': "F(n) computation: {:.2f} µs (n = {})",
             'opt_time': "Time: {:.6f} seconds",
             'opt_memory': "Memory Usage: {:.2f} KB",
+            'opt_rss': "Process RSS growth: {:.2f} KB",
             'opt_passwords': "PASSWORDS GENERATED WITH OPTIMAL ALGORITHM",
             'save_all': "Would you like to save passwords generated by all algorithms? (Y/N):",
             'alg_passwords_saved': "Passwords from {} algorithm saved to {} file."
         }
 
+_IMPORT_FINISHED = time.perf_counter()
+
 if __name__ == "__main__":
     try:
         main()
@@ -0,0 +1,91 @@
+import functools
+import json
+import os
+import tempfile
+import unittest
+
+import fibonacci_cipher as fc
+
+
+def _forked_output(produce):
+    """produce() çıktısını fork edilmiş bir çocuk süreçte üretip döndürür."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            os.write(write_fd, produce())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as pipe:
+        data = pipe.read()
+    os.waitpid(pid, 0)
+    return data
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), "fork gerektirir")
+class EntropyForkTests(unittest.TestCase):
+
+    def test_default_entropy_differs_after_fork(self):
+        fc.DEFAULT_ENTROPY.randbytes(16)  # tamponu doldur
+        child = _forked_output(lambda: fc.DEFAULT_ENTROPY.randbytes(32))
+        self.assertEqual(len(child), 32)
+        self.assertNotEqual(child, fc.DEFAULT_ENTROPY.randbytes(32))
+
+    def test_passwords_differ_after_fork(self):
+        fc.generate_passwords(1, 16)
+        child = _forked_output(lambda: fc.generate_passwords(1, 16)[0].encode())
+        self.assertNotEqual(child.decode(), fc.generate_passwords(1, 16)[0])
+
+    def test_private_source_differs_after_fork(self):
+        entropy = fc.EntropySource()
+        entropy.randbytes(16)
+        child = _forked_output(lambda: entropy.randbytes(32))
+        self.assertNotEqual(child, entropy.randbytes(32))
+
+
+class NaiveKeystreamTests(unittest.TestCase):
+
+    def setUp(self):
+        self.naive = fc.get_fib_method(fc.FibonacciMethods(), 'naive')
+        # Pozisyon başına gerçek naive çağrıları; önbellek yalnızca testi hızlandırır
+        self.per_position = functools.lru_cache(maxsize=None)(self.naive)
+
+    def test_capped_stream_matches_per_position_calls(self):
+        for modulus in (None, 256, 1 << 32):
+            for start in (0, 20, 25, 40):
+                capped = fc.FibonacciKeystream(self.naive, start, modulus=modulus)
+                reference = fc.FibonacciKeystream(self.per_position, start, incremental=False, modulus=modulus)
+                self.assertIsNone(capped.fib_method)
+                self.assertEqual([next(capped) for _ in range(60)], [next(reference) for _ in range(60)],
+                                 (modulus, start))
+
+    def test_naive_bytes_match_per_position_output(self):
+        data = bytes(range(192, 256))  # 3..66 pozisyonları: 25 sınırını geçer
+        reference = fc.FibonacciKeystream(self.per_position, 3, incremental=False, modulus=256)
+        expected = bytes((byte + value) & 0xFF for byte, value in zip(data, reference))
+        encrypted = fc.encrypt_bytes(data, self.naive, 3)
+        self.assertEqual(encrypted, expected)
+        self.assertEqual(fc.decrypt_bytes(encrypted, self.naive, 3), data)
+
+
+class FibonacciTableTests(unittest.TestCase):
+
+    def test_tampered_table_file_is_ignored_and_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'table.json')
+            fc.FibonacciTable(64).save(path)
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            data["values"][6] = '9'
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            table = fc.FibonacciTable(64, path)
+            self.assertTrue(table.stale)
+            self.assertEqual(table[6], 8)
+            self.assertTrue(fc.FibonacciTable.is_valid(table.values))
+
+
+if __name__ == '__main__':
+    unittest.main()